@@ -0,0 +1,294 @@
+"""Headless, reproducible benchmark suite for FixedSizeHashMap and ResizableHashMap.
+
+Replaces the plotting __main__ blocks that used to live in hash_tables.py:
+
+    python bench_suite.py run --sizes 1000 10000 100000 -o results.json
+    python bench_suite.py run --workloads hit miss --format csv -o results.csv
+    python bench_suite.py plot results.json -o results.png
+
+Every trial builds its map from the same seed (keys and hash family), runs
+with the cyclic GC paused and is timed with perf_counter; warmup trials
+are discarded. Plotting is a separate step and the only one that needs
+matplotlib, which it drives through the non-interactive Agg backend.
+"""
+import argparse
+import csv
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from hash_tables import np, FixedSizeHashMap, ResizableHashMap
+
+WORKLOADS = ("insert", "hit", "miss", "delete", "mixed")
+MAPS = ("fixed", "resizable")
+FIELDS = ("map", "workload", "n", "key_type", "load_factor", "multiplier", "repeats", "warmup",
+          "min_s", "median_s", "mean_s", "stdev_s", "ops_per_s")
+
+# Mixed workload: share of each operation in the stream
+MIXED_MIX = (("hit", 0.5), ("miss", 0.2), ("put", 0.2), ("remove", 0.1))
+
+
+def make_keys(n: int, key_type: str, rng: random.Random) -> Tuple[List[Any], List[Any]]:
+    """n distinct present keys and n distinct keys that are never inserted."""
+    ints = rng.sample(range(10 * n + 10), 2 * n)
+    keys: List[Any] = ints if key_type == "int" else [f"key:{k:012d}" for k in ints]
+    return keys[:n], keys[n:]
+
+
+def mixed_ops(present: List[Any], absent: List[Any], rng: random.Random) -> List[Tuple[str, Any]]:
+    """len(present) operations drawn from MIXED_MIX."""
+    names = [name for name, share in MIXED_MIX]
+    weights = [share for name, share in MIXED_MIX]
+    ops = []
+    for name in rng.choices(names, weights, k=len(present)):
+        key = rng.choice(absent) if name == "miss" else rng.choice(present)
+        ops.append((name, key))
+    return ops
+
+
+def make_map(case: Dict[str, Any], n: int) -> Any:
+    multiplier = case["multiplier"]
+    if case["map"] == "fixed":
+        return FixedSizeHashMap(max(1, int(n * multiplier)))
+    load_factor = case["load_factor"]
+    initial_size = max(1, int(n * multiplier)) if multiplier else 16
+    return ResizableHashMap(initial_size, load_factor)
+
+
+def run_trial(workload: str, case: Dict[str, Any], present: List[Any], absent: List[Any],
+              ops: List[Tuple[str, Any]], seed: int) -> float:
+    """Seconds for one trial; building the map for read workloads is not timed."""
+    random.seed(seed)  # Same hash family in every trial
+    n = len(present)
+    if workload == "insert":
+        start = time.perf_counter()
+        hm = make_map(case, n)
+        for key in present:
+            hm.put(key, key)
+        return time.perf_counter() - start
+
+    hm = make_map(case, n)
+    for key in present:
+        hm.put(key, key)
+    start = time.perf_counter()
+    if workload == "hit":
+        for key in present:
+            hm.get(key)
+    elif workload == "miss":
+        for key in absent:
+            hm.get(key)
+    elif workload == "delete":
+        for key in present:
+            hm.remove(key)
+    else:
+        for name, key in ops:
+            if name == "put":
+                hm.put(key, key)
+            elif name == "remove":
+                hm.remove(key)
+            else:
+                hm.get(key)
+    return time.perf_counter() - start
+
+
+def measure(workload: str, case: Dict[str, Any], n: int, key_type: str,
+            repeats: int, warmup: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    present, absent = make_keys(n, key_type, rng)
+    ops = mixed_ops(present, absent, rng) if workload == "mixed" else []
+
+    samples = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for trial in range(warmup + repeats):
+            elapsed = run_trial(workload, case, present, absent, ops, seed)
+            if trial >= warmup:
+                samples.append(elapsed)
+            gc.collect()  # Between trials, outside the timed region
+    finally:
+        if enabled:
+            gc.enable()
+
+    median = statistics.median(samples)
+    return {
+        "map": case["map"],
+        "workload": workload,
+        "n": n,
+        "key_type": key_type,
+        "load_factor": case["load_factor"],
+        "multiplier": case["multiplier"],
+        "repeats": repeats,
+        "warmup": warmup,
+        "min_s": min(samples),
+        "median_s": median,
+        "mean_s": statistics.fmean(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "ops_per_s": n / median if median > 0 else float("inf"),
+    }
+
+
+def expand_cases(maps: Sequence[str], load_factors: Sequence[float],
+                 multipliers: Sequence[float]) -> List[Dict[str, Any]]:
+    """Map configurations to run.
+
+    A fixed map gets m = multiplier * n buckets (multiplier 0 is skipped).
+    A resizable map runs every load factor threshold with an initial size of
+    multiplier * n, where multiplier 0 stands for the default of 16.
+    """
+    cases = []
+    for name in maps:
+        if name == "fixed":
+            cases += [{"map": name, "load_factor": None, "multiplier": mult}
+                      for mult in multipliers if mult > 0]
+        else:
+            cases += [{"map": name, "load_factor": lf, "multiplier": mult}
+                      for lf in load_factors for mult in multipliers]
+    return cases
+
+
+def run_suite(sizes: Sequence[int], workloads: Sequence[str], cases: List[Dict[str, Any]],
+              key_type: str = "int", repeats: int = 5, warmup: int = 1, seed: int = 42,
+              progress: bool = False) -> List[Dict[str, Any]]:
+    results = []
+    for n in sizes:
+        for case in cases:
+            for workload in workloads:
+                row = measure(workload, case, n, key_type, repeats, warmup, seed)
+                results.append(row)
+                if progress:
+                    print(f"{row['map']:<10}{workload:<8}n={n:<9}lf={row['load_factor']!s:<5}"
+                          f"mult={row['multiplier']:<5}{row['median_s']:.6f}s", file=sys.stderr)
+    return results
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__ if np is not None else None,
+    }
+
+
+def write_results(results: List[Dict[str, Any]], meta: Dict[str, Any], fmt: str, out: Any) -> None:
+    if fmt == "json":
+        json.dump({"meta": meta, "results": results}, out, indent=2)
+        out.write("\n")
+    else:
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def read_results(path: str) -> List[Dict[str, Any]]:
+    """Rows from a JSON or CSV file written by the run command."""
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            rows: List[Dict[str, Any]] = list(csv.DictReader(f))
+            for row in rows:
+                row["n"] = int(row["n"])
+                row["median_s"] = float(row["median_s"])
+                row["load_factor"] = float(row["load_factor"]) if row["load_factor"] else None
+                row["multiplier"] = float(row["multiplier"])
+            return rows
+        return json.load(f)["results"]
+
+
+def plot_results(results: List[Dict[str, Any]], output: str) -> None:
+    """One log-log panel per workload: median time against n, a line per map case."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    workloads = [w for w in WORKLOADS if any(row["workload"] == w for row in results)]
+    fig, axes = plt.subplots(1, len(workloads), figsize=(5 * len(workloads), 4), squeeze=False)
+    for ax, workload in zip(axes[0], workloads):
+        lines: Dict[str, List[Tuple[int, float]]] = {}
+        for row in results:
+            if row["workload"] != workload:
+                continue
+            if row["map"] == "fixed":
+                label = f"fixed m={row['multiplier']}n"
+            else:
+                initial = f"{row['multiplier']}n" if row["multiplier"] else "16"
+                label = f"resizable lf={row['load_factor']} init={initial}"
+            lines.setdefault(label, []).append((row["n"], row["median_s"]))
+        for label, points in sorted(lines.items()):
+            points.sort()
+            ax.plot([n for n, s in points], [s for n, s in points], marker="o", label=label)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.grid(True, which="both", linestyle="--", alpha=0.7)
+        ax.set_title(workload)
+        ax.set_xlabel("Size (n)")
+        ax.set_ylabel("Median time (s)")
+    axes[0][0].legend(fontsize="small")
+    fig.tight_layout()
+    fig.savefig(output)
+    plt.close(fig)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks and write JSON or CSV")
+    run.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    run.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    run.add_argument("--maps", nargs="+", choices=MAPS, default=list(MAPS))
+    run.add_argument("--load-factors", type=float, nargs="+", default=[0.5, 0.75, 1.5],
+                     help="growth thresholds of the resizable map")
+    run.add_argument("--multipliers", type=float, nargs="+", default=[0, 0.5, 1.0],
+                     help="buckets (fixed) or initial size (resizable) as a multiple of n; "
+                          "0 means the resizable default")
+    run.add_argument("--key-type", choices=("int", "str"), default="int")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--format", choices=("json", "csv"), default=None,
+                     help="defaults to the extension of --output, else json")
+    run.add_argument("-o", "--output", help="file to write (default: stdout)")
+    run.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+
+    plot = commands.add_parser("plot", help="render results to an image (needs matplotlib)")
+    plot.add_argument("results", help="JSON or CSV file written by run")
+    plot.add_argument("-o", "--output", default="hash_tables_benchmark.png")
+
+    args = parser.parse_args(argv)
+    if args.command == "plot":
+        try:
+            plot_results(read_results(args.results), args.output)
+        except ImportError:
+            print("plotting needs matplotlib", file=sys.stderr)
+            return 1
+        return 0
+
+    if args.repeats < 1 or args.warmup < 0:
+        parser.error("--repeats must be at least 1 and --warmup at least 0")
+    fmt = args.format or ("csv" if args.output and args.output.endswith(".csv") else "json")
+    cases = expand_cases(args.maps, args.load_factors, args.multipliers)
+    results = run_suite(args.sizes, args.workloads, cases, args.key_type, args.repeats,
+                        args.warmup, args.seed, progress=not args.quiet)
+    meta = {
+        "environment": environment(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("command", "quiet")},
+    }
+    if args.output:
+        with open(args.output, "w", newline="") as out:
+            write_results(results, meta, fmt, out)
+    else:
+        write_results(results, meta, fmt, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,691 @@
+import gc
+import multiprocessing
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from hash_tables import FixedSizeHashMap, OrderedHashMap, ResizableHashMap, _capacity_prime
+from cache import LFUCache, LRUCache
+from compact import CompactHashMap
+from cuckoo import CuckooHashMap
+from hash_set import HashSet
+from parallel import build_parallel
+from robin_hood import RobinHoodHashMap
+from sharded import ShardedHashMap
+from snapshot import MappedHashMap, save_snapshot
+
+
+def _throughput(op: Callable[[Any], Any], keys: List[int]) -> float:
+    """Operations per second of op applied to every key."""
+    start = time.perf_counter()
+    for key in keys:
+        op(key)
+    end = time.perf_counter()
+    return len(keys) / (end - start)
+
+
+def chained_probe_lengths(hm: FixedSizeHashMap) -> Dict[str, float]:
+    """Average and maximum bucket positions scanned by successful lookups."""
+    total = 0
+    longest = 0
+    for bucket in hm.buckets:
+        length = len(bucket)
+        total += length * (length + 1) // 2
+        longest = max(longest, length)
+    avg = total / hm.size() if hm.size() else 0.0
+    return {"avg": avg, "max": longest}
+
+
+def bench_open_addressing_vs_chained(m: int = 1 << 16,
+                                     load_factors: Tuple[float, ...] = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95),
+                                     seed: int = 42) -> List[Dict[str, Any]]:
+    results = []
+    for lf in load_factors:
+        n = int(m * lf)
+        rng = random.Random(seed)
+        keys = rng.sample(range(10 * m), n)
+        misses = [k + 10 * m for k in rng.sample(range(10 * m), n)]
+
+        for name, factory in (("chained", lambda: FixedSizeHashMap(m)),
+                              ("robin_hood", lambda: RobinHoodHashMap(m, load_factor_threshold=0.99))):
+            hm = factory()
+            row: Dict[str, Any] = {"map": name, "load_factor": lf, "n": n}
+            row["insert_ops"] = _throughput(lambda k: hm.put(k, k), keys)
+            row["hit_ops"] = _throughput(hm.get, keys)
+            row["miss_ops"] = _throughput(hm.get, misses)
+            if isinstance(hm, RobinHoodHashMap):
+                row["avg_probe"] = hm.average_probe_length()
+                row["max_probe"] = hm.max_probe_length()
+            else:
+                probes = chained_probe_lengths(hm)
+                row["avg_probe"] = probes["avg"]
+                row["max_probe"] = probes["max"]
+            results.append(row)
+    return results
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    index = min(len(sorted_samples) - 1, int(q * len(sorted_samples)))
+    return sorted_samples[index]
+
+
+def bench_resize_latency(n: int = 1_000_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Per-put latency of ResizableHashMap with stop-the-world vs incremental resizing."""
+    results = []
+    for incremental in (False, True):
+        rng = random.Random(seed)
+        keys = [rng.randint(0, 10 * n) for _ in range(n)]
+        rhm = ResizableHashMap(incremental=incremental)
+        samples = []
+        clock = time.perf_counter
+        # Cyclic GC passes over millions of tuples cause their own pauses;
+        # keep them out so the numbers reflect the resize strategy only.
+        gc.disable()
+        try:
+            for key in keys:
+                start = clock()
+                rhm.put(key, key)
+                samples.append(clock() - start)
+        finally:
+            gc.enable()
+        total = sum(samples)
+        samples.sort()
+        results.append({
+            "mode": "incremental" if incremental else "stop-the-world",
+            "n": n,
+            "total_s": total,
+            "p50_us": _percentile(samples, 0.50) * 1e6,
+            "p99_us": _percentile(samples, 0.99) * 1e6,
+            "max_ms": samples[-1] * 1e3,
+        })
+    return results
+
+
+def _random_urls(n: int, rng: random.Random) -> List[str]:
+    hosts = ["example.com", "data.unal.edu.co", "api.service.io", "cdn.static.net"]
+    alphabet = "abcdefghijklmnopqrstuvwxyz0123456789-_"
+    return [f"https://{rng.choice(hosts)}/" + "/".join(
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 12)))
+                for _ in range(rng.randint(2, 6)))
+            for _ in range(n)]
+
+
+def bench_string_hashing(n: int = 100_000, m: int = 1 << 17, seed: int = 42) -> List[Dict[str, Any]]:
+    """Hashing cost of URL-like keys: per-character loop, cached and batched."""
+    rng = random.Random(seed)
+    urls = _random_urls(n, rng)
+    results = []
+    
+    plain = FixedSizeHashMap(m)
+    start = time.perf_counter()
+    for url in urls:
+        plain._hash_str(url)
+    results.append({"path": "scalar", "n": n, "seconds": time.perf_counter() - start})
+    
+    cached = FixedSizeHashMap(m, hash_cache_size=n)
+    for url in urls:
+        cached._hash_str(url)  # Warm the cache
+    start = time.perf_counter()
+    for url in urls:
+        cached._hash_str(url)
+    results.append({"path": "cached (warm)", "n": n, "seconds": time.perf_counter() - start})
+    
+    start = time.perf_counter()
+    plain.hash_str_many(urls)
+    results.append({"path": "batched", "n": n, "seconds": time.perf_counter() - start})
+    return results
+
+
+def bench_batch_int_ops(n: int = 1_000_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Per-key loop vs put_many/get_many/remove_many on ResizableHashMap."""
+    rng = random.Random(seed)
+    keys = [rng.randint(0, 10 * n) for _ in range(n)]
+    values = list(range(n))
+    results = []
+    
+    loop_map = ResizableHashMap()
+    start = time.perf_counter()
+    for key, value in zip(keys, values):
+        loop_map.put(key, value)
+    put_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in keys:
+        loop_map.get(key)
+    get_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in keys:
+        loop_map.remove(key)
+    remove_loop = time.perf_counter() - start
+    
+    batch_map = ResizableHashMap()
+    start = time.perf_counter()
+    batch_map.put_many(keys, values)
+    put_batch = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_map.get_many(keys)
+    get_batch = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_map.remove_many(keys)
+    remove_batch = time.perf_counter() - start
+    
+    for op, loop_s, batch_s in (("put", put_loop, put_batch), ("get", get_loop, get_batch),
+                                ("remove", remove_loop, remove_batch)):
+        results.append({"op": op, "n": n, "loop_s": loop_s, "batch_s": batch_s})
+    return results
+
+
+def bench_compact_storage(n: int = 1_000_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Bytes per entry and throughput of list-of-tuples vs parallel-column storage."""
+    rng = random.Random(seed)
+    keys = rng.sample(range(10 * n), n)
+    results = []
+    for name, hm in (("chained", FixedSizeHashMap(n)), ("compact", CompactHashMap(n))):
+        row: Dict[str, Any] = {"map": name, "n": n}
+        row["insert_ops"] = _throughput(lambda k: hm.put(k, k), keys)
+        row["hit_ops"] = _throughput(hm.get, keys)
+        row.update(hm.memory_usage())
+        results.append(row)
+    return results
+
+
+def bench_sharded_scaling(threads: int = 8, ops_per_thread: int = 100_000,
+                          shard_counts: Tuple[int, ...] = (1, 2, 4, 8, 16),
+                          seed: int = 42) -> List[Dict[str, Any]]:
+    """Mixed-workload throughput of ShardedHashMap as the shard count grows.
+    
+    One shard is the single-global-lock baseline. On a GIL build the
+    interpreter still serializes bytecode, so the gain there comes from
+    less lock contention; free-threaded builds can scale further.
+    """
+    results = []
+    for shards in shard_counts:
+        hm = ShardedHashMap(shards)
+        workloads = []
+        for t in range(threads):
+            rng = random.Random(seed + t)
+            workloads.append([(rng.random(), rng.randint(0, 10 * ops_per_thread))
+                              for _ in range(ops_per_thread)])
+        
+        def worker(ops: List[Tuple[float, int]]) -> None:
+            for r, key in ops:
+                if r < 0.5:
+                    hm.get(key)
+                elif r < 0.8:
+                    hm.put(key, key)
+                elif r < 0.9:
+                    hm.compute_if_absent(key, lambda k: k)
+                else:
+                    hm.remove(key)
+        
+        pool = [threading.Thread(target=worker, args=(ops,)) for ops in workloads]
+        start = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results.append({"shards": shards, "threads": threads,
+                        "ops_per_s": threads * ops_per_thread / elapsed})
+    return results
+
+
+def _resident_bytes() -> Optional[int]:
+    """Current resident set size (Linux only)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _snapshot_startup_child(mode: str, path: str, n: int, probes: int, seed: int) -> Dict[str, Any]:
+    """Runs in a fresh process so resident memory is not shared with the parent."""
+    rng = random.Random(seed)
+    keys = [rng.randint(0, 10 * n) for _ in range(n)] if mode == "rebuild" else []
+    probe_keys = [rng.randint(0, 10 * n) for _ in range(probes)]
+    
+    rss_before = _resident_bytes()
+    start = time.perf_counter()
+    if mode == "rebuild":
+        hm: Any = ResizableHashMap()
+        for key in keys:
+            hm.put(key, key)
+    else:
+        hm = MappedHashMap(path)
+    startup = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for key in probe_keys:
+        hm.get(key)
+    probe_time = time.perf_counter() - start
+    rss_after = _resident_bytes()
+    
+    return {"mode": mode, "n": n, "startup_s": startup, "probe_s": probe_time,
+            "rss_delta_mb": (rss_after - rss_before) / 2**20 if rss_before and rss_after else None}
+
+
+def bench_snapshot_startup(n: int = 1_000_000, probes: int = 10_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Warm restart: replaying puts vs opening a memory-mapped snapshot."""
+    rng = random.Random(seed)
+    hm = ResizableHashMap()
+    hm.put_many([rng.randint(0, 10 * n) for _ in range(n)], list(range(n)))
+    
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "map.snap")
+        start = time.perf_counter()
+        save_snapshot(hm, path)
+        save_time = time.perf_counter() - start
+        del hm
+        
+        results = []
+        for mode in ("rebuild", "mmap"):
+            with ctx.Pool(1) as pool:
+                row = pool.apply(_snapshot_startup_child, (mode, path, n, probes, seed))
+            row["save_s"] = save_time
+            row["file_mb"] = os.path.getsize(path) / 2**20
+            results.append(row)
+    return results
+
+
+def bench_lookup_tail_latency(n: int = 200_000, probes: int = 200_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """p50/p99/max get latency for chained, Robin Hood and cuckoo maps."""
+    rng = random.Random(seed)
+    keys = rng.sample(range(10 * n), n)
+    probe_keys = [rng.choice(keys) if rng.random() < 0.8 else 10 * n + rng.randint(0, n)
+                  for _ in range(probes)]
+    results = []
+    for name, hm in (("chained", ResizableHashMap()), ("robin_hood", RobinHoodHashMap()),
+                     ("cuckoo", CuckooHashMap())):
+        for key in keys:
+            hm.put(key, key)
+        samples = []
+        clock = time.perf_counter
+        gc.disable()
+        try:
+            for key in probe_keys:
+                start = clock()
+                hm.get(key)
+                samples.append(clock() - start)
+        finally:
+            gc.enable()
+        samples.sort()
+        results.append({"map": name, "n": n,
+                        "p50_us": _percentile(samples, 0.50) * 1e6,
+                        "p99_us": _percentile(samples, 0.99) * 1e6,
+                        "max_us": samples[-1] * 1e6})
+    return results
+
+
+def zipf_stream(n: int, universe: int, s: float, rng: random.Random) -> List[int]:
+    """n keys drawn from 0..universe-1 with P(k) proportional to 1 / (k + 1)^s."""
+    weights = [1 / (k + 1) ** s for k in range(universe)]
+    keys = list(range(universe))
+    rng.shuffle(keys)  # Popular keys should not be the small integers
+    return rng.choices(keys, weights=weights, k=n)
+
+
+def bench_bounded_caches(n: int = 500_000, universe: int = 100_000, capacity: int = 5_000,
+                         exponents: Tuple[float, ...] = (0.8, 1.0, 1.2),
+                         seed: int = 42) -> List[Dict[str, Any]]:
+    """Hit rate and throughput of read-through LRU/LFU caches on Zipf streams."""
+    results = []
+    for s in exponents:
+        stream = zipf_stream(n, universe, s, random.Random(seed))
+        for name, cache in (("lru", LRUCache(capacity)), ("lfu", LFUCache(capacity))):
+            start = time.perf_counter()
+            for key in stream:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+            elapsed = time.perf_counter() - start
+            row: Dict[str, Any] = {"policy": name, "zipf_s": s, "n": n, "ops_per_s": n / elapsed}
+            row.update(cache.stats())
+            results.append(row)
+    return results
+
+
+def bench_instrumentation_overhead(n: int = 300_000, repeats: int = 3, seed: int = 42) -> List[Dict[str, Any]]:
+    """put/get/remove cycle time with instrumentation off and on (best of repeats)."""
+    rng = random.Random(seed)
+    keys = [rng.randint(0, 10 * n) for _ in range(n)]
+    results = []
+    for instrument in (False, True):
+        best = float("inf")
+        for _ in range(repeats):
+            hm = ResizableHashMap(instrument=instrument)
+            start = time.perf_counter()
+            for key in keys:
+                hm.put(key, key)
+            for key in keys:
+                hm.get(key)
+            for key in keys:
+                hm.remove(key)
+            best = min(best, time.perf_counter() - start)
+        results.append({"instrument": instrument, "n": n, "seconds": best})
+    return results
+
+
+def _trial_division_prime(n: int) -> int:
+    """The prime search FixedSizeHashMap used before the capacity schedule."""
+    def is_prime(num: int) -> bool:
+        if num <= 3:
+            return num > 1
+        if num % 2 == 0 or num % 3 == 0:
+            return False
+        i = 5
+        while i * i <= num:
+            if num % i == 0 or num % (i + 2) == 0:
+                return False
+            i += 6
+        return True
+    while not is_prime(n):
+        n += 1
+    return n
+
+
+def bench_table_construction(sizes: Tuple[int, ...] = (16, 256, 4096, 65536, 1 << 20, 1 << 24, 10 ** 8)
+                             ) -> List[Dict[str, Any]]:
+    """Prime selection, table construction and empty-map resize time per size."""
+    results = []
+    for m in sizes:
+        row: Dict[str, Any] = {"m": m}
+        start = time.perf_counter()
+        _trial_division_prime(m * 100)
+        row["trial_division_s"] = time.perf_counter() - start
+        start = time.perf_counter()
+        _capacity_prime(m * 100)
+        row["schedule_s"] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        table = FixedSizeHashMap(m)
+        row["construct_s"] = time.perf_counter() - start
+        del table
+        
+        # A resize of a map holding a single key isolates the fixed cost
+        hm = ResizableHashMap()
+        hm.put(0, 0)
+        start = time.perf_counter()
+        hm._rebuild(m)
+        row["resize_s"] = time.perf_counter() - start
+        del hm
+        results.append(row)
+    return results
+
+
+def _keywise_set_op(op: str, a: List[int], b: List[int]) -> ResizableHashMap:
+    """Set algebra the way it was done before HashSet: a map with dummy
+    values, filled one key at a time."""
+    left, right = ResizableHashMap(), ResizableHashMap()
+    for key in a:
+        left.put(key, True)
+    for key in b:
+        right.put(key, True)
+    result = ResizableHashMap()
+    if op == "union":
+        for key in a:
+            result.put(key, True)
+        for key in b:
+            result.put(key, True)
+    elif op == "intersection":
+        for key in a:
+            if right.get(key) is not None:
+                result.put(key, True)
+    else:
+        for key in a:
+            if right.get(key) is None:
+                result.put(key, True)
+    return result
+
+
+def bench_set_algebra(n: int = 1_000_000, small: int = 100_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Key-by-key map building vs HashSet bulk operations on a large and a small set."""
+    rng = random.Random(seed)
+    a = rng.sample(range(10 * n), n)
+    b = rng.sample(range(10 * n), small)
+    set_a, set_b = HashSet(), HashSet()
+    set_a.add_many(a)
+    set_b.add_many(b)
+    results = []
+    for op in ("union", "intersection", "difference"):
+        start = time.perf_counter()
+        expected = _keywise_set_op(op, a, b).size()
+        keywise_s = time.perf_counter() - start
+        
+        # The baseline builds its operands too, so the bulk path pays for them as well
+        start = time.perf_counter()
+        left, right = HashSet(), HashSet()
+        left.add_many(a)
+        right.add_many(b)
+        getattr(left, op)(right)
+        bulk_s = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        size = getattr(set_a, op)(set_b).size()
+        op_s = time.perf_counter() - start
+        assert size == expected
+        results.append({"op": op, "n": n, "small": small, "size": size,
+                        "keywise_s": keywise_s, "bulk_s": bulk_s, "op_only_s": op_s})
+    
+    probes = rng.sample(range(10 * n), small)
+    start = time.perf_counter()
+    loop_hits = sum(set_a.contains(key) for key in probes)
+    loop_s = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_hits = sum(set_a.contains_many(probes))
+    batch_s = time.perf_counter() - start
+    assert loop_hits == batch_hits
+    results.append({"op": "contains", "n": n, "small": small, "size": batch_hits,
+                    "keywise_s": loop_s, "bulk_s": batch_s, "op_only_s": batch_s})
+    return results
+
+
+def bench_bloom_filter(n: int = 200_000, probes: int = 200_000, miss_ratio: float = 0.9,
+                       load_factors: Tuple[float, ...] = (0.75, 4.0), repeats: int = 3,
+                       seed: int = 42) -> List[Dict[str, Any]]:
+    """Miss-heavy get workload on ResizableHashMap with and without the Bloom filter."""
+    rng = random.Random(seed)
+    results = []
+    for kind in ("int", "str"):
+        if kind == "int":
+            keys: List[Any] = rng.sample(range(10 ** 9), n + probes)
+        else:
+            keys = _random_urls(n + probes, rng)
+        present, absent = keys[:n], keys[n:]
+        misses = int(probes * miss_ratio)
+        workload = absent[:misses] + rng.sample(present, probes - misses)
+        rng.shuffle(workload)
+        for load_factor in load_factors:
+            row: Dict[str, Any] = {"keys": kind, "n": n, "load_factor": load_factor}
+            for bits in (0, 10):
+                hm = ResizableHashMap(load_factor_threshold=load_factor, bloom_bits_per_key=bits,
+                                      shrink_threshold=0.01)
+                hm.put_many(present, present)
+                best = float("inf")
+                gc.disable()
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    for key in workload:
+                        hm.get(key)
+                    best = min(best, time.perf_counter() - start)
+                gc.enable()
+                row["filtered_s" if bits else "plain_s"] = best
+                if hm.bloom is not None:
+                    row["fp_rate"] = hm.bloom.false_positive_rate()
+                    row["expected_fp_rate"] = hm.bloom.expected_false_positive_rate()
+            results.append(row)
+    return results
+
+
+def bench_parallel_build(n: int = 2_000_000, workers: Tuple[int, ...] = (1, 2, 4, 8),
+                         seed: int = 42) -> List[Dict[str, Any]]:
+    """Serial put_many vs build_parallel with 1..N worker processes."""
+    rng = random.Random(seed)
+    pairs = [(rng.randint(0, 10 * n), i) for i in range(n)]
+    results = []
+    
+    start = time.perf_counter()
+    serial = FixedSizeHashMap(n)
+    serial.put_many([key for key, value in pairs], [value for key, value in pairs])
+    serial_s = time.perf_counter() - start
+    results.append({"workers": 0, "n": n, "seconds": serial_s, "speedup": 1.0})
+    del serial
+    
+    for count in workers:
+        gc.collect()
+        start = time.perf_counter()
+        table = build_parallel(pairs, workers=count, m=n)
+        elapsed = time.perf_counter() - start
+        del table
+        results.append({"workers": count, "n": n, "seconds": elapsed, "speedup": serial_s / elapsed})
+    return results
+
+
+def bench_composite_keys(n: int = 200_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """(user id, url) tuple keys vs the stringified keys they used to need, and
+    resize time for string keys now that hashes are stored with the entries."""
+    rng = random.Random(seed)
+    urls = _random_urls(n, rng)
+    pairs = [(rng.randint(0, 10 ** 6), url) for url in urls]
+    results = []
+    for name, to_key in (("str(key)", lambda pair: f"{pair[0]}|{pair[1]}"), ("tuple", lambda pair: pair)):
+        hm = ResizableHashMap(instrument=True)
+        gc.disable()
+        start = time.perf_counter()
+        for pair in pairs:
+            hm.put(to_key(pair), pair[0])
+        put_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for pair in pairs:
+            hm.get(to_key(pair))
+        get_s = time.perf_counter() - start
+        gc.enable()
+        results.append({"keys": name, "n": n, "put_s": put_s, "get_s": get_s,
+                        "resize_s": hm.stats.resize_seconds})
+    return results
+
+
+def bench_iteration_views(n: int = 1_000_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Full scan summing the values: materializing a list from .map.buckets
+    vs streaming items(), with peak extra memory from tracemalloc."""
+    rng = random.Random(seed)
+    keys = rng.sample(range(10 * n), n)
+    hm = ResizableHashMap()
+    hm.put_many(keys, keys)
+    ordered = OrderedHashMap()
+    ordered.put_many(keys, keys)
+    
+    def materialized() -> int:
+        entries = [(k, v) for bucket in hm.map.buckets for k, v, h in bucket]
+        return sum(v for k, v in entries)
+    
+    scans = (("list(.buckets)", materialized),
+             ("items()", lambda: sum(v for k, v in hm.items())),
+             ("ordered items()", lambda: sum(v for k, v in ordered.items())))
+    results = []
+    for name, scan in scans:
+        start = time.perf_counter()
+        total = scan()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        scan()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({"scan": name, "n": n, "seconds": elapsed, "peak_mb": peak / 2**20, "total": total})
+    return results
+
+
+if __name__ == "__main__":
+    print(f"{'map':<12}{'lf':>6}{'insert/s':>12}{'hit/s':>12}{'miss/s':>12}{'avg probe':>11}{'max probe':>11}")
+    for row in bench_open_addressing_vs_chained():
+        print(f"{row['map']:<12}{row['load_factor']:>6.2f}{row['insert_ops']:>12.0f}"
+              f"{row['hit_ops']:>12.0f}{row['miss_ops']:>12.0f}"
+              f"{row['avg_probe']:>11.2f}{row['max_probe']:>11}")
+
+    print()
+    print(f"{'mode':<16}{'total s':>10}{'p50 us':>10}{'p99 us':>10}{'max ms':>10}")
+    for row in bench_resize_latency():
+        print(f"{row['mode']:<16}{row['total_s']:>10.2f}{row['p50_us']:>10.2f}"
+              f"{row['p99_us']:>10.2f}{row['max_ms']:>10.2f}")
+
+    print()
+    print(f"{'hash path':<16}{'seconds':>10}{'keys/s':>14}")
+    for row in bench_string_hashing():
+        print(f"{row['path']:<16}{row['seconds']:>10.3f}{row['n'] / row['seconds']:>14.0f}")
+
+    print()
+    print(f"{'batch op':<10}{'loop s':>10}{'batch s':>10}{'speedup':>10}")
+    for row in bench_batch_int_ops():
+        print(f"{row['op']:<10}{row['loop_s']:>10.2f}{row['batch_s']:>10.2f}"
+              f"{row['loop_s'] / row['batch_s']:>10.2f}")
+
+    print()
+    print(f"{'storage':<10}{'bytes/entry':>13}{'total MB':>10}{'insert/s':>12}{'hit/s':>12}")
+    for row in bench_compact_storage():
+        print(f"{row['map']:<10}{row['bytes_per_entry']:>13.1f}{row['total'] / 2**20:>10.1f}"
+              f"{row['insert_ops']:>12.0f}{row['hit_ops']:>12.0f}")
+
+    print()
+    print(f"{'shards':>8}{'threads':>9}{'ops/s':>12}")
+    for row in bench_sharded_scaling():
+        print(f"{row['shards']:>8}{row['threads']:>9}{row['ops_per_s']:>12.0f}")
+
+    print()
+    print(f"{'restart':<10}{'startup s':>11}{'probe s':>10}{'RSS +MB':>10}")
+    for row in bench_snapshot_startup():
+        rss = f"{row['rss_delta_mb']:.1f}" if row["rss_delta_mb"] is not None else "n/a"
+        print(f"{row['mode']:<10}{row['startup_s']:>11.4f}{row['probe_s']:>10.4f}{rss:>10}")
+
+    print()
+    print(f"{'lookup':<12}{'p50 us':>10}{'p99 us':>10}{'max us':>10}")
+    for row in bench_lookup_tail_latency():
+        print(f"{row['map']:<12}{row['p50_us']:>10.2f}{row['p99_us']:>10.2f}{row['max_us']:>10.2f}")
+
+    print()
+    print(f"{'policy':<8}{'zipf s':>8}{'hit rate':>10}{'evictions':>11}{'ops/s':>12}")
+    for row in bench_bounded_caches():
+        print(f"{row['policy']:<8}{row['zipf_s']:>8.1f}{row['hit_rate']:>10.3f}"
+              f"{row['evictions']:>11}{row['ops_per_s']:>12.0f}")
+
+    print()
+    print(f"{'instrument':<12}{'seconds':>10}")
+    for row in bench_instrumentation_overhead():
+        print(f"{str(row['instrument']):<12}{row['seconds']:>10.3f}")
+
+    print()
+    print(f"{'buckets':>12}{'trial div s':>13}{'schedule s':>12}{'construct s':>13}{'resize s':>10}")
+    for row in bench_table_construction():
+        print(f"{row['m']:>12}{row['trial_division_s']:>13.6f}{row['schedule_s']:>12.6f}"
+              f"{row['construct_s']:>13.6f}{row['resize_s']:>10.6f}")
+
+    print()
+    print(f"{'set op':<14}{'result':>9}{'key-wise s':>12}{'bulk s':>9}{'op only s':>11}")
+    for row in bench_set_algebra():
+        print(f"{row['op']:<14}{row['size']:>9}{row['keywise_s']:>12.3f}{row['bulk_s']:>9.3f}"
+              f"{row['op_only_s']:>11.3f}")
+
+    print()
+    print(f"{'bloom':<6}{'load':>6}{'plain s':>9}{'bloom s':>9}{'speedup':>9}{'FP rate':>10}{'model':>10}")
+    for row in bench_bloom_filter():
+        print(f"{row['keys']:<6}{row['load_factor']:>6.2f}{row['plain_s']:>9.3f}{row['filtered_s']:>9.3f}"
+              f"{row['plain_s'] / row['filtered_s']:>9.2f}{row['fp_rate']:>10.5f}{row['expected_fp_rate']:>10.5f}")
+
+    print()
+    print(f"cpus: {os.cpu_count()}")
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>9}")
+    for row in bench_parallel_build():
+        label = row["workers"] or "put_many"
+        print(f"{label:>8}{row['seconds']:>10.3f}{row['speedup']:>9.2f}")
+
+    print()
+    print(f"{'keys':<10}{'put s':>8}{'get s':>8}{'resize s':>10}")
+    for row in bench_composite_keys():
+        print(f"{row['keys']:<10}{row['put_s']:>8.3f}{row['get_s']:>8.3f}{row['resize_s']:>10.3f}")
+
+    print()
+    print(f"{'scan':<18}{'seconds':>9}{'peak MB':>9}")
+    for row in bench_iteration_views():
+        print(f"{row['scan']:<18}{row['seconds']:>9.3f}{row['peak_mb']:>9.2f}")
@@ -0,0 +1,231 @@
+from typing import Any, Dict, Optional, Generic
+
+from hash_tables import K, ResizableHashMap
+
+
+class CacheNode(Generic[K]):
+    """Entry of an intrusive doubly linked list; the cache keeps a handle to
+    it in the hash map so it can be unlinked in O(1)."""
+
+    __slots__ = ("key", "value", "parent", "prev", "next")
+
+    def __init__(self, key: K, value: Any):
+        self.key: K = key
+        self.value: Any = value
+        self.parent: Any = None  # FrequencyNode owning this node (LFU only)
+        self.prev: Optional[CacheNode[K]] = None
+        self.next: Optional[CacheNode[K]] = None
+
+
+class RecencyList(Generic[K]):
+    """Doubly linked list of CacheNode, most recent at the head.
+
+    Same shape as the DoublyLinkedList in list_implementation, except that
+    it links the nodes it is given instead of wrapping values, which is what
+    makes unlink O(1).
+    """
+
+    def __init__(self) -> None:
+        self.head: Optional[CacheNode[K]] = None
+        self.tail: Optional[CacheNode[K]] = None
+
+    def push_front(self, node: CacheNode[K]) -> None:
+        """Add a node to the front of the list."""
+        node.prev = None
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        else:
+            self.tail = node
+        self.head = node
+
+    def unlink(self, node: CacheNode[K]) -> None:
+        """Remove a node that is known to be in this list."""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+
+    def pop_back(self) -> CacheNode[K]:
+        """Remove and return the last (least recent) node."""
+        if not self.tail:
+            raise IndexError("List is empty")
+        node = self.tail
+        self.unlink(node)
+        return node
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty."""
+        return self.head is None
+
+
+class BoundedCache(Generic[K]):
+    """Shared bookkeeping of the bounded caches: key -> node map and counters."""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.map: ResizableHashMap[K] = ResizableHashMap[K]()
+        self.map.reserve(capacity)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def size(self) -> int:
+        return self.map.size()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class LRUCache(BoundedCache[K]):
+    """Evicts the least recently used key once capacity is reached."""
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.order: RecencyList[K] = RecencyList[K]()
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        node = self.map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.unlink(node)
+        self.order.push_front(node)
+        return node.value
+
+    def put(self, key: K, value: Any) -> None:
+        node = self.map.get(key)
+        if node is not None:
+            node.value = value
+            self.order.unlink(node)
+            self.order.push_front(node)
+            return
+
+        if self.map.size() >= self.capacity:
+            evicted = self.order.pop_back()
+            self.map.remove(evicted.key)
+            self.evictions += 1
+        node = CacheNode(key, value)
+        self.order.push_front(node)
+        self.map.put(key, node)
+
+    def remove(self, key: K) -> bool:
+        node = self.map.get(key)
+        if node is None:
+            return False
+        self.order.unlink(node)
+        self.map.remove(key)
+        return True
+
+
+class FrequencyNode(Generic[K]):
+    """All cache nodes that have been accessed exactly freq times."""
+
+    __slots__ = ("freq", "items", "prev", "next")
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.items: RecencyList[K] = RecencyList[K]()
+        self.prev: Optional[FrequencyNode[K]] = None
+        self.next: Optional[FrequencyNode[K]] = None
+
+
+class LFUCache(BoundedCache[K]):
+    """Evicts the least frequently used key, breaking ties by recency.
+
+    Frequency groups form their own doubly linked list in increasing order,
+    so the eviction victim is always at the back of the head group and a
+    hit only ever moves a node to the neighbouring group: every operation
+    is O(1).
+    """
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self.freq_head: Optional[FrequencyNode[K]] = None
+
+    def _insert_group_after(self, prev: Optional[FrequencyNode[K]], freq: int) -> FrequencyNode[K]:
+        group = FrequencyNode[K](freq)
+        group.prev = prev
+        group.next = prev.next if prev else self.freq_head
+        if group.next:
+            group.next.prev = group
+        if prev:
+            prev.next = group
+        else:
+            self.freq_head = group
+        return group
+
+    def _drop_group_if_empty(self, group: FrequencyNode[K]) -> None:
+        if not group.items.is_empty():
+            return
+        if group.prev:
+            group.prev.next = group.next
+        else:
+            self.freq_head = group.next
+        if group.next:
+            group.next.prev = group.prev
+
+    def _touch(self, node: CacheNode[K]) -> None:
+        """Move a node to the group of the next access count."""
+        group = node.parent
+        target = group.next
+        if target is None or target.freq != group.freq + 1:
+            target = self._insert_group_after(group, group.freq + 1)
+        group.items.unlink(node)
+        target.items.push_front(node)
+        node.parent = target
+        self._drop_group_if_empty(group)
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        node = self.map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key: K, value: Any) -> None:
+        node = self.map.get(key)
+        if node is not None:
+            node.value = value
+            self._touch(node)
+            return
+
+        if self.map.size() >= self.capacity:
+            victims = self.freq_head
+            evicted = victims.items.pop_back()
+            self._drop_group_if_empty(victims)
+            self.map.remove(evicted.key)
+            self.evictions += 1
+
+        group = self.freq_head
+        if group is None or group.freq != 1:
+            group = self._insert_group_after(None, 1)
+        node = CacheNode(key, value)
+        node.parent = group
+        group.items.push_front(node)
+        self.map.put(key, node)
+
+    def remove(self, key: K) -> bool:
+        node = self.map.get(key)
+        if node is None:
+            return False
+        node.parent.items.unlink(node)
+        self._drop_group_if_empty(node.parent)
+        self.map.remove(key)
+        return True
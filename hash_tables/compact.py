@@ -0,0 +1,119 @@
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Generic
+
+from hash_tables import K, _draw_hash_family, _full_hash
+
+
+class CompactHashMap(Generic[K]):
+    """Chained hash map stored in parallel columns instead of bucket lists.
+
+    heads[b] holds the index of the first entry of bucket b (-1 if empty),
+    and each entry i is spread over hashes[i], next[i], keys[i], values[i].
+    There is no per-bucket list and no per-entry tuple; removal moves the
+    last entry into the freed index so the columns stay dense.
+    """
+
+    __slots__ = ("m", "p", "a", "b", "x", "_heads", "_hashes", "_next", "_keys", "_values")
+
+    def __init__(self, m: int):
+        self.m = m
+        self._heads = array('q', [-1]) * m
+        self._hashes = array('q')
+        self._next = array('q')
+        self._keys: List[K] = []
+        self._values: List[Any] = []
+
+        # Same universal family as FixedSizeHashMap
+        self.p, self.a, self.b, self.x = _draw_hash_family(m * 100)
+
+    def _hash(self, key: K) -> int:
+        """Full hash of the key modulo p; the bucket is this value mod m."""
+        return _full_hash(key, self.p, self.a, self.b, self.x)
+
+    def _find(self, key: K, h: int) -> int:
+        """Return the entry index of key, or -1 if it is absent."""
+        hashes, keys, nxt = self._hashes, self._keys, self._next
+        i = self._heads[h % self.m]
+        while i != -1:
+            if hashes[i] == h and keys[i] == key:
+                return i
+            i = nxt[i]
+        return -1
+
+    def put(self, key: K, value: Any) -> None:
+        h = self._hash(key)
+        i = self._find(key, h)
+        if i != -1:
+            self._values[i] = value  # Update value
+            return
+
+        bucket = h % self.m
+        self._hashes.append(h)
+        self._next.append(self._heads[bucket])
+        self._keys.append(key)
+        self._values.append(value)
+        self._heads[bucket] = len(self._keys) - 1
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        i = self._find(key, self._hash(key))
+        if i == -1:
+            return default
+        return self._values[i]
+
+    def remove(self, key: K) -> bool:
+        h = self._hash(key)
+        heads, hashes, keys, nxt = self._heads, self._hashes, self._keys, self._next
+        bucket = h % self.m
+
+        # Unlink the entry from its chain
+        prev = -1
+        i = heads[bucket]
+        while i != -1 and not (hashes[i] == h and keys[i] == key):
+            prev = i
+            i = nxt[i]
+        if i == -1:
+            return False
+        if prev == -1:
+            heads[bucket] = nxt[i]
+        else:
+            nxt[prev] = nxt[i]
+
+        # Move the last entry into the hole and repoint whoever linked to it
+        last = len(keys) - 1
+        if i != last:
+            last_bucket = hashes[last] % self.m
+            if heads[last_bucket] == last:
+                heads[last_bucket] = i
+            else:
+                j = heads[last_bucket]
+                while nxt[j] != last:
+                    j = nxt[j]
+                nxt[j] = i
+            hashes[i] = hashes[last]
+            nxt[i] = nxt[last]
+            keys[i] = keys[last]
+            self._values[i] = self._values[last]
+
+        hashes.pop()
+        nxt.pop()
+        keys.pop()
+        self._values.pop()
+        return True
+
+    def size(self) -> int:
+        return len(self._keys)
+
+    def memory_usage(self) -> Dict[str, float]:
+        """Bytes used by the table structure, excluding the key and value objects."""
+        buckets = sys.getsizeof(self._heads)
+        entries = (sys.getsizeof(self._hashes) + sys.getsizeof(self._next)
+                   + sys.getsizeof(self._keys) + sys.getsizeof(self._values))
+        total = buckets + entries
+        count = len(self._keys)
+        return {
+            "buckets": buckets,
+            "entries": entries,
+            "total": total,
+            "bytes_per_entry": total / count if count else 0.0,
+        }
@@ -0,0 +1,136 @@
+import random
+from typing import Any, List, Optional, Tuple, Generic
+
+from hash_tables import K, _capacity_prime, _full_hash
+
+_EMPTY: Any = object()  # Marks a free slot in a key column
+
+
+class CuckooHashMap(Generic[K]):
+    """Cuckoo hash map: every key lives in one of `tables` fixed slots or in a
+    small stash, so a lookup inspects at most tables + stash_size entries.
+
+    Each table draws its own (a, b, x) from the universal family of
+    FixedSizeHashMap over a shared prime p. An insert that keeps evicting
+    for max_loop rounds parks the last displaced entry in the stash; when
+    the stash is full the tables are rebuilt with fresh parameters.
+    """
+
+    def __init__(self, m: int = 16, tables: int = 2, load_factor_threshold: float = 0.45,
+                 stash_size: int = 4):
+        if tables < 2:
+            raise ValueError("Cuckoo hashing needs at least two tables")
+        self.tables = tables
+        self.load_factor_threshold = load_factor_threshold
+        self.stash_size = stash_size
+        self._count = 0
+        self._init_tables(m)
+
+    def _init_tables(self, m: int) -> None:
+        self.m = m
+        self.max_loop = 6 * max(1, m.bit_length())
+        self._keys: List[List[Any]] = [[_EMPTY] * m for _ in range(self.tables)]
+        self._values: List[List[Any]] = [[None] * m for _ in range(self.tables)]
+        self._stash: List[Tuple[K, Any]] = []
+
+        self.p = _capacity_prime(m * 100)
+        self.a = [random.randint(1, self.p - 1) for _ in range(self.tables)]
+        self.b = [random.randint(0, self.p - 1) for _ in range(self.tables)]
+        self.x = [random.randint(1, self.p - 1) for _ in range(self.tables)]
+
+    def _hash(self, key: K, t: int) -> int:
+        return _full_hash(key, self.p, self.a[t], self.b[t], self.x[t]) % self.m
+
+    def _place(self, key: K, value: Any) -> Optional[Tuple[K, Any]]:
+        """Insert an absent key, evicting residents into their other tables.
+
+        Returns the entry left without a slot after max_loop evictions (not
+        necessarily the one passed in), or None when everything fit.
+        """
+        t = 0
+        for _ in range(self.max_loop):
+            h = self._hash(key, t)
+            keys, values = self._keys[t], self._values[t]
+            if keys[h] is _EMPTY:
+                keys[h], values[h] = key, value
+                return None
+            key, keys[h] = keys[h], key
+            value, values[h] = values[h], value
+            t = (t + 1) % self.tables
+        return key, value
+
+    def _place_or_stash(self, key: K, value: Any) -> Optional[Tuple[K, Any]]:
+        homeless = self._place(key, value)
+        if homeless is not None and len(self._stash) < self.stash_size:
+            self._stash.append(homeless)
+            return None
+        return homeless
+
+    def _rehash(self, new_m: int, pending: List[Tuple[K, Any]]) -> None:
+        """Rebuild every table with fresh hash parameters, growing if needed."""
+        entries = list(self._stash) + pending
+        for keys, values in zip(self._keys, self._values):
+            for key, value in zip(keys, values):
+                if key is not _EMPTY:
+                    entries.append((key, value))
+
+        attempts = 0
+        while True:
+            self._init_tables(new_m)
+            if all(self._place_or_stash(key, value) is None for key, value in entries):
+                return
+            attempts += 1
+            if attempts % 4 == 0:
+                new_m *= 2  # Repeated failures: the tables are too full
+
+    def _find(self, key: K) -> Tuple[int, int]:
+        """(table, slot) of key, (-1, stash index) if stashed, or (-1, -1)."""
+        for t in range(self.tables):
+            h = self._hash(key, t)
+            if self._keys[t][h] == key:
+                return t, h
+        for i, (k, v) in enumerate(self._stash):
+            if k == key:
+                return -1, i
+        return -1, -1
+
+    def put(self, key: K, value: Any) -> None:
+        t, i = self._find(key)
+        if t >= 0:
+            self._values[t][i] = value  # Update value
+            return
+        if i >= 0:
+            self._stash[i] = (key, value)
+            return
+
+        if self._count + 1 > self.load_factor_threshold * self.tables * self.m:
+            self._rehash(self.m * 2, [])
+        homeless = self._place_or_stash(key, value)
+        if homeless is not None:
+            self._rehash(self.m, [homeless])
+        self._count += 1
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        for t in range(self.tables):
+            h = self._hash(key, t)
+            if self._keys[t][h] == key:
+                return self._values[t][h]
+        for k, v in self._stash:
+            if k == key:
+                return v
+        return default
+
+    def remove(self, key: K) -> bool:
+        t, i = self._find(key)
+        if t >= 0:
+            self._keys[t][i] = _EMPTY
+            self._values[t][i] = None
+        elif i >= 0:
+            self._stash.pop(i)
+        else:
+            return False
+        self._count -= 1
+        return True
+
+    def size(self) -> int:
+        return self._count
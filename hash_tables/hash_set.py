@@ -0,0 +1,189 @@
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Generic
+
+from hash_tables import K, np, _draw_hash_family, _full_hash, _mulmod_np, _poly_hash_many
+
+
+class HashSet(Generic[K]):
+    """Resizable chained hash set whose buckets hold bare keys.
+
+    Same hashing and growth policy as ResizableHashMap, minus the value slot.
+    The bulk operations iterate the smaller operand and allocate the result
+    at its final capacity, so they never resize midway.
+    """
+
+    def __init__(self, initial_size: int = 16, load_factor_threshold: float = 0.75,
+                 hash_family: Optional[Tuple[int, int, int, int]] = None):
+        self.load_factor_threshold = load_factor_threshold
+        self.min_capacity = initial_size
+        self.count = 0
+        self._family = hash_family or _draw_hash_family(max(initial_size * 100, 1 << 30))
+        self._allocate(initial_size)
+
+    def _allocate(self, capacity: int) -> None:
+        if self._family[0] < capacity * 100:
+            self._family = _draw_hash_family(capacity * 100)
+        self.p, self.a, self.b, self.x = self._family
+        self.capacity = capacity
+        self.buckets: List[List[K]] = [()] * capacity  # type: ignore
+
+    def _hash(self, key: K) -> int:
+        return _full_hash(key, self.p, self.a, self.b, self.x) % self.capacity
+
+    def _hash_many(self, keys: List[K]) -> List[int]:
+        """Bucket indices of many keys, vectorized like FixedSizeHashMap._hash_many."""
+        if np is not None and keys and self.p < 1 << 47:
+            if all(type(k) is int for k in keys):
+                array = np.array(keys)
+                if array.dtype.kind == "i":
+                    hashes = (_mulmod_np(array % self.p, self.a, self.p) + self.b) % self.p
+                    return (hashes % self.capacity).tolist()
+            elif all(type(k) is str for k in keys):
+                return [h % self.capacity for h in _poly_hash_many(keys, self.x, self.p)]
+        return [self._hash(k) for k in keys]
+
+    def _fit_capacity(self, n: int) -> int:
+        capacity = self.min_capacity
+        while n / capacity > self.load_factor_threshold:
+            capacity *= 2
+        return capacity
+
+    def _rebuild(self, new_capacity: int) -> None:
+        keys = list(self)
+        self._allocate(new_capacity)
+        self.count = 0
+        self._add_absent(keys)
+
+    def _add_absent(self, keys: List[K]) -> None:
+        """Insert keys known to be distinct and absent, with no bucket scans."""
+        buckets = self.buckets
+        for hash_value, key in zip(self._hash_many(keys), keys):
+            bucket = buckets[hash_value]
+            if bucket:
+                bucket.append(key)
+            else:
+                buckets[hash_value] = [key]
+        self.count += len(keys)
+
+    def _empty_like(self, n: int) -> "HashSet[K]":
+        """Empty set sized for n keys, sharing this set's hash family."""
+        result = HashSet[K](self.min_capacity, self.load_factor_threshold, self._family)
+        capacity = result._fit_capacity(n)
+        if capacity != result.capacity:
+            result._allocate(capacity)
+        return result
+
+    def add(self, key: K) -> bool:
+        """Insert key; returns False if it was already present."""
+        hash_value = self._hash(key)
+        bucket = self.buckets[hash_value]
+        if key in bucket:
+            return False
+        if (self.count + 1) / self.capacity > self.load_factor_threshold:
+            self._rebuild(self.capacity * 2)
+            hash_value = self._hash(key)
+            bucket = self.buckets[hash_value]
+        if bucket:
+            bucket.append(key)
+        else:
+            self.buckets[hash_value] = [key]
+        self.count += 1
+        return True
+
+    def add_many(self, keys: Sequence[K]) -> int:
+        """Insert many keys, resizing at most once; returns how many were new."""
+        keys = list(keys)
+        capacity = self._fit_capacity(self.count + len(keys))
+        if capacity > self.capacity:
+            self._rebuild(capacity)
+        buckets = self.buckets
+        added = 0
+        for hash_value, key in zip(self._hash_many(keys), keys):
+            bucket = buckets[hash_value]
+            if not bucket:
+                buckets[hash_value] = [key]
+            elif key not in bucket:
+                bucket.append(key)
+            else:
+                continue
+            added += 1
+        self.count += added
+        return added
+
+    def contains(self, key: K) -> bool:
+        return key in self.buckets[self._hash(key)]
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+    def contains_many(self, keys: Sequence[K]) -> List[bool]:
+        """Membership of many keys, hashed in one vectorized pass."""
+        keys = list(keys)
+        buckets = self.buckets
+        return [key in buckets[hash_value] for hash_value, key in zip(self._hash_many(keys), keys)]
+
+    def remove(self, key: K) -> bool:
+        bucket = self.buckets[self._hash(key)]
+        if key not in bucket:
+            return False
+        bucket.remove(key)
+        self.count -= 1
+        return True
+
+    def size(self) -> int:
+        return self.count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[K]:
+        for bucket in self.buckets:
+            yield from bucket
+
+    def copy(self) -> "HashSet[K]":
+        result = HashSet[K](self.min_capacity, self.load_factor_threshold, self._family)
+        result._allocate(self.capacity)
+        result.buckets = [list(bucket) if bucket else () for bucket in self.buckets]  # type: ignore
+        result.count = self.count
+        return result
+
+    def union(self, other: "HashSet[K]") -> "HashSet[K]":
+        larger, smaller = (self, other) if self.count >= other.count else (other, self)
+        if larger._fit_capacity(larger.count + smaller.count) == larger.capacity:
+            result = larger.copy()  # Bucket lists copy over without rehashing
+        else:
+            result = larger._empty_like(larger.count + smaller.count)
+            result._add_absent(list(larger))
+        buckets = result.buckets
+        added = 0
+        for key in smaller:
+            hash_value = result._hash(key)
+            bucket = buckets[hash_value]
+            if not bucket:
+                buckets[hash_value] = [key]
+            elif key not in bucket:
+                bucket.append(key)
+            else:
+                continue
+            added += 1
+        result.count += added
+        return result
+
+    def intersection(self, other: "HashSet[K]") -> "HashSet[K]":
+        larger, smaller = (self, other) if self.count >= other.count else (other, self)
+        result = smaller._empty_like(smaller.count)
+        keys = list(smaller)
+        result._add_absent([key for key, found in zip(keys, larger.contains_many(keys)) if found])
+        return result
+
+    def difference(self, other: "HashSet[K]") -> "HashSet[K]":
+        """Keys of self that are not in other."""
+        if other.count < self.count:
+            # Cheaper to copy self and strike out the smaller operand
+            result = self.copy()
+            for key in other:
+                result.remove(key)
+            return result
+        keys = list(self)
+        result = self._empty_like(self.count)
+        result._add_absent([key for key, found in zip(keys, other.contains_many(keys)) if not found])
+        return result
@@ -1,10 +1,199 @@
+import bisect
+import dataclasses
+import json
+import math
 import random
-from typing import Any, List, Optional, Tuple, TypeVar, Generic, Protocol
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, Generic, Protocol
 from abc import ABC, abstractmethod
 import time
-import matplotlib.pyplot as plt
+from array import array
+try:
+    import numpy as np  # Optional: only the batched paths use it
+except ImportError:
+    np = None
 K = TypeVar('K', int, str)
 
+# Distinguishes "key absent" from a stored None value
+_MISSING: Any = object()
+
+def _as_list(items: Sequence[Any]) -> List[Any]:
+    """items as a list of Python objects; NumPy arrays go through tolist."""
+    if np is not None and isinstance(items, np.ndarray):
+        return items.tolist()
+    return list(items)
+
+# The first 13 primes as witnesses make Miller-Rabin exact for every
+# n < 3.3 * 10^24 (without 41 the bound drops to about 3.18 * 10^23)
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def _is_prime(n: int) -> bool:
+    """Deterministic Miller-Rabin primality test."""
+    if n < 2:
+        return False
+    for q in _MR_BASES:
+        if n % q == 0:
+            return n == q
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _next_prime(n: int) -> int:
+    """Smallest prime >= n."""
+    n = max(n, 2)
+    if n > 2 and n % 2 == 0:
+        n += 1
+    while not _is_prime(n):
+        n += 2 if n > 2 else 1
+    return n
+
+def _prev_prime(n: int) -> int:
+    """Largest prime <= n."""
+    while not _is_prime(n):
+        n -= 1
+    return n
+
+# Capacity schedule: the largest prime below each power of two, so picking
+# the modulus for a table is a bisect instead of a search. Keeping p under
+# 2^31 where possible also keeps the NumPy batch paths on their fast route.
+_PRIME_SCHEDULE = [_prev_prime((1 << k) - 1) for k in range(2, 65)]
+
+def _capacity_prime(n: int) -> int:
+    """A prime >= n: from the schedule when in range, else by search."""
+    i = bisect.bisect_left(_PRIME_SCHEDULE, n)
+    if i < len(_PRIME_SCHEDULE):
+        return _PRIME_SCHEDULE[i]
+    return _next_prime(n)
+
+def _draw_hash_family(min_p: int) -> Tuple[int, int, int, int]:
+    """(p, a, b, x) for (ax + b) mod p and a polynomial string hash in x."""
+    p = _capacity_prime(min_p)
+    return p, random.randint(1, p - 1), random.randint(0, p - 1), random.randint(1, p - 1)
+
+_BATCH_CHUNK = 1 << 15  # Strings hashed per NumPy matrix in _poly_hash_many
+
+def _mulmod_np(h: Any, c: int, p: int) -> Any:
+    """Elementwise (h * c) % p for an int64 array h in [0, p) and p < 2^47."""
+    if p < 1 << 31:
+        return h * c % p
+    # Multiply by c one 16-bit limb at a time so no product leaves int64
+    acc = np.zeros_like(h)
+    for shift in (32, 16, 0):
+        acc = ((acc << 16) % p + h * ((c >> shift) & 0xFFFF) % p) % p
+    return acc
+
+def _poly_hash(key: str, x: int, p: int) -> int:
+    """Polynomial hash of a string in x (mod p), by Horner's rule."""
+    hash_value = 0
+    for char in key:
+        hash_value = (hash_value * x + ord(char)) % p
+    return hash_value
+
+def _poly_hash_many(keys: Sequence[str], x: int, p: int) -> List[int]:
+    """Polynomial hash (mod p) of every string, matching _poly_hash exactly.
+    
+    Strings are laid out as rows of code points (UTF-32), right-aligned so
+    that the zero padding on the left leaves the Horner accumulator at 0,
+    and Horner's rule then runs once per column for the whole batch.
+    """
+    # h * x must fit in int64; beyond 2^47 even 16-bit limbs would overflow
+    if np is None or p >= 1 << 47:
+        return [_poly_hash(key, x, p) for key in keys]
+    
+    result: List[int] = []
+    for start in range(0, len(keys), _BATCH_CHUNK):
+        chunk = keys[start:start + _BATCH_CHUNK]
+        lengths = np.fromiter((len(key) for key in chunk), dtype=np.int64, count=len(chunk))
+        width = int(lengths.max()) if len(chunk) else 0
+        codes = np.zeros((len(chunk), width), dtype=np.int64)
+        codes[np.arange(width) >= (width - lengths)[:, None]] = np.frombuffer(
+            "".join(chunk).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        
+        h = np.zeros(len(chunk), dtype=np.int64)
+        for j in range(width):
+            h = (_mulmod_np(h, x, p) + codes[:, j]) % p
+        result.extend(h.tolist())
+    return result
+
+def _full_hash(key: Any, p: int, a: int, b: int, x: int) -> int:
+    """Full hash (mod p) of key under the universal family (p, a, b, x).
+    
+    Every table built on _draw_hash_family hashes through here, so they all
+    accept the same key types and agree on which keys are equal.
+    """
+    if isinstance(key, int):
+        return (a * key + b) % p
+    elif isinstance(key, str):
+        return _poly_hash(key, x, p)
+    else:
+        return _composite_hash(key, p, a, b, x)
+
+def _composite_hash(key: Any, p: int, a: int, b: int, x: int) -> int:
+    """Full hash (mod p) of keys that are neither int nor str.
+    
+    bytes use the polynomial string hash over byte values. A float equal
+    to an int hashes like that int, so 1.0 and 1 stay the same key, and
+    other finite floats map their exact ratio n/d to n * d^-1 mod p.
+    Tuples (and namedtuples) fold their components' hashes with the
+    polynomial hash, frozensets add them, and frozen dataclasses hash
+    like the tuple of the fields they compare by.
+    """
+    if isinstance(key, bytes):
+        hash_value = 0
+        for byte in key:
+            hash_value = (hash_value * x + byte) % p
+        return hash_value
+    elif isinstance(key, float):
+        if key.is_integer():
+            return (a * int(key) + b) % p
+        if key != key or key in (math.inf, -math.inf):
+            return (a * hash(key) + b) % p
+        numerator, denominator = key.as_integer_ratio()
+        return (a * numerator * pow(denominator, -1, p) + b) % p
+    elif isinstance(key, tuple):
+        hash_value = 0
+        for item in key:
+            hash_value = (hash_value * x + _full_hash(item, p, a, b, x)) % p
+        return hash_value
+    elif isinstance(key, frozenset):
+        return sum(_full_hash(item, p, a, b, x) for item in key) % p
+    elif _is_dataclass_key(key):
+        hash_value = 0
+        for name in _compared_fields(key):
+            hash_value = (hash_value * x + _full_hash(getattr(key, name), p, a, b, x)) % p
+        return hash_value
+    else:
+        raise TypeError("Key must be an int, str, bytes, float, tuple, frozenset "
+                        "or frozen dataclass (with eq) of those")
+
+def _is_dataclass_key(key: Any) -> bool:
+    """True for instances of frozen dataclasses that compare by value.
+    
+    An eq=False dataclass compares by identity, which no hash of its
+    fields can respect, so it is not accepted as a key.
+    """
+    if not dataclasses.is_dataclass(key) or isinstance(key, type):
+        return False
+    params = key.__dataclass_params__
+    return params.frozen and params.eq
+
+def _compared_fields(key: Any) -> List[str]:
+    """Names of the fields that take part in the key's ==, in order."""
+    return [field.name for field in dataclasses.fields(key) if field.compare]
+
 class HashMap(Protocol, Generic[K]):
     @abstractmethod
     def put(self, key: K, value: Any) -> None:
@@ -27,48 +216,185 @@ class HashMap(Protocol, Generic[K]):
         pass
 
 
+class HashMapStats:
+    """Counters collected by an instrumented hash map.
+    
+    Scan length is the number of bucket entries compared by one operation:
+    the position of the key plus one on a hit, the whole bucket on a miss.
+    While a resizable map migrates, a lookup that checks both tables counts
+    once, with the entries compared in both.
+    """
+    
+    OPS = ("get", "put", "remove", "setdefault", "get_or_insert", "update_with")
+    
+    def __init__(self) -> None:
+        self.lookups = {op: 0 for op in self.OPS}
+        self.scanned = {op: 0 for op in self.OPS}
+        self.max_scan = {op: 0 for op in self.OPS}
+        self.hash_calls = 0
+        self.hash_seconds = 0.0
+        self.resizes = 0
+        self.resize_seconds = 0.0
+    
+    def record_scan(self, op: str, length: int) -> None:
+        self.lookups[op] += 1
+        self.scanned[op] += length
+        if length > self.max_scan[op]:
+            self.max_scan[op] = length
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scan": {op: {"count": self.lookups[op],
+                          "avg": self.scanned[op] / self.lookups[op] if self.lookups[op] else 0.0,
+                          "max": self.max_scan[op]}
+                     for op in self.OPS},
+            "hash_calls": self.hash_calls,
+            "hash_seconds": self.hash_seconds,
+            "resizes": self.resizes,
+            "resize_seconds": self.resize_seconds,
+        }
+
+
+_BLOOM_PATTERN_BITS = 10  # Bits of h2 that select each half mask
+_BLOOM_PATTERNS = 1 << _BLOOM_PATTERN_BITS
+_bloom_pattern_cache: Dict[Tuple[int, int], List[int]] = {}
+
+def _bloom_patterns(bits: int, salt: int) -> List[int]:
+    """_BLOOM_PATTERNS fixed 64-bit masks with `bits` bits set, shared by all filters."""
+    patterns = _bloom_pattern_cache.get((bits, salt))
+    if patterns is None:
+        rng = random.Random(bits * 2 + salt)
+        patterns = [sum(1 << bit for bit in rng.sample(range(64), bits)) for _ in range(_BLOOM_PATTERNS)]
+        _bloom_pattern_cache[bits, salt] = patterns
+    return patterns
+
+
+class BloomFilter:
+    """Blocked Bloom filter that answers "definitely absent" or "maybe present".
+    
+    It works on full hashes (mod p) from the owning table, so a lookup hashes
+    its key once for both the filter and the bucket. h1 picks a 64-bit word
+    and h2, a second (a, b) draw over the same p applied to h1, picks a k-bit
+    mask as the OR of two precomputed half masks, so a probe is one AND
+    instead of k bit tests. Keys cannot be removed; the owner rebuilds the
+    filter instead.
+    """
+    
+    def __init__(self, expected: int, bits_per_key: int, p: int):
+        nbits = 64
+        while nbits < expected * bits_per_key:
+            nbits *= 2
+        self.nbits = nbits
+        self.word_mask = (nbits >> 6) - 1
+        self.words = array('Q', [0]) * (nbits >> 6)
+        self.k = max(1, round(bits_per_key * math.log(2)))
+        self.low_patterns = _bloom_patterns(self.k - self.k // 2, 0)
+        self.high_patterns = _bloom_patterns(max(1, self.k // 2), 1)
+        self.p = p
+        self.a2 = random.randint(1, p - 1)
+        self.b2 = random.randint(0, p - 1)
+        self.added = 0
+        self.rejections = 0  # Absent keys stopped by the filter
+        self.false_positives = 0  # Absent keys the filter let through
+    
+    def _pattern(self, h1: int) -> int:
+        h2 = (self.a2 * h1 + self.b2) % self.p
+        return (self.low_patterns[h2 & (_BLOOM_PATTERNS - 1)]
+                | self.high_patterns[(h2 >> _BLOOM_PATTERN_BITS) & (_BLOOM_PATTERNS - 1)])
+    
+    def add_hash(self, h1: int) -> None:
+        self.words[h1 & self.word_mask] |= self._pattern(h1)
+        self.added += 1
+    
+    def might_contain_hash(self, h1: int) -> bool:
+        h2 = (self.a2 * h1 + self.b2) % self.p  # Inlined _pattern: this is the hot path
+        pattern = (self.low_patterns[h2 & (_BLOOM_PATTERNS - 1)]
+                   | self.high_patterns[(h2 >> _BLOOM_PATTERN_BITS) & (_BLOOM_PATTERNS - 1)])
+        return self.words[h1 & self.word_mask] & pattern == pattern
+    
+    def false_positive_rate(self) -> float:
+        """Share of absent keys looked up so far that got past the filter."""
+        negatives = self.rejections + self.false_positives
+        return self.false_positives / negatives if negatives else 0.0
+    
+    def expected_false_positive_rate(self) -> float:
+        """Model rate for the keys added since the last rebuild: a word holding
+        j keys has about 1 - (1 - 1/64)^(jk) of its bits set, and j is Poisson."""
+        load = self.added * 64 / self.nbits
+        rate = 0.0
+        weight = math.exp(-load)  # P(j = 0)
+        for j in range(1, int(load + 10 * math.sqrt(load)) + 20):
+            weight *= load / j
+            rate += weight * (1 - (1 - 1 / 64) ** (j * self.k)) ** self.k
+        return rate
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bits": self.nbits,
+            "hashes": self.k,
+            "added": self.added,
+            "rejections": self.rejections,
+            "false_positives": self.false_positives,
+            "false_positive_rate": self.false_positive_rate(),
+            "expected_false_positive_rate": self.expected_false_positive_rate(),
+        }
+
+
 class FixedSizeHashMap(Generic[K]):
-    def __init__(self, m: int):
+    def __init__(self, m: int, hash_cache_size: int = 0, instrument: bool = False,
+                 hash_family: Optional[Tuple[int, int, int, int]] = None):
         self.m = m
-        self.buckets: List[List[Tuple[K, Any]]] = [[] for _ in range(m)]
+        # Empty buckets share one immutable tuple; a bucket only gets its own
+        # list on first insert, so building a large table is a single allocation.
+        # Entries are (key, value, full hash of key mod p) triples.
+        self.buckets: List[List[Tuple[K, Any, int]]] = [()] * m  # type: ignore
         self._count = 0
+        # Bumped by every insert and removal so live views can detect them
+        self._version = 0
         
-        # For integer hashing (ax + b) mod p mod m
-        self.p = self._find_prime_larger_than(m * 100)
-        self.a = random.randint(1, self.p - 1)
-        self.b = random.randint(0, self.p - 1)
+        # For integer hashing (ax + b) mod p mod m, and x for the polynomial
+        # string hash. A resizing owner may pass in the family it already uses.
+        if hash_family is None:
+            hash_family = _draw_hash_family(m * 100)
+        self.p, self.a, self.b, self.x = hash_family
         
-        # For string hashing (polynomial hash)
-        self.x = random.randint(1, self.p - 1)
-    
-    def _find_prime_larger_than(self, n: int) -> int:
-        """Find a prime number larger than n."""
-        def is_prime(num: int) -> bool:
-            if num <= 1:
-                return False
-            if num <= 3:
-                return True
-            if num % 2 == 0 or num % 3 == 0:
-                return False
-            i = 5
-            while i * i <= num:
-                if num % i == 0 or num % (i + 2) == 0:
-                    return False
-                i += 6
-            return True
+        # Bounded FIFO cache of string key -> polynomial hash (mod p)
+        self.hash_cache_size = hash_cache_size
+        self._str_hash_cache: Optional[Dict[str, int]] = {} if hash_cache_size > 0 else None
         
-        while not is_prime(n):
-            n += 1
-        return n
+        # Disabled instrumentation costs one None check per get/put/remove
+        self.stats: Optional[HashMapStats] = HashMapStats() if instrument else None
     
     def _hash_int(self, key: int) -> int:
         return ((self.a * key + self.b) % self.p) % self.m
     
+    def _poly_hash(self, key: str) -> int:
+        return _poly_hash(key, self.x, self.p)
+    
+    def _full_hash_str(self, key: str) -> int:
+        cache = self._str_hash_cache
+        if cache is None:
+            return self._poly_hash(key)
+        
+        hash_value = cache.get(key)
+        if hash_value is None:
+            hash_value = self._poly_hash(key)
+            if len(cache) >= self.hash_cache_size:
+                del cache[next(iter(cache))]  # Evict the oldest entry
+            cache[key] = hash_value
+        return hash_value
+    
     def _hash_str(self, key: str) -> int:
-        hash_value = 0
-        for char in key:
-            hash_value = (hash_value * self.x + ord(char)) % self.p
-        return hash_value % self.m
+        return self._full_hash_str(key) % self.m
+    
+    def hash_str_many(self, keys: Sequence[str]) -> List[int]:
+        """Bucket indices of many string keys, hashed in one vectorized pass."""
+        m = self.m
+        return [h % m for h in _poly_hash_many(keys, self.x, self.p)]
+    
+    def _composite_hash(self, key: Any) -> int:
+        """Full hash (mod p) of keys that are neither int nor str."""
+        return _composite_hash(key, self.p, self.a, self.b, self.x)
     
     def _hash(self, key: K) -> int:
         if isinstance(key, int):
@@ -76,206 +402,804 @@ class FixedSizeHashMap(Generic[K]):
         elif isinstance(key, str):
             return self._hash_str(key)
         else:
-            raise TypeError("Key must be an integer or string")
+            return self._composite_hash(key) % self.m
     
-    def put(self, key: K, value: Any) -> None:
-        hash_value = self._hash(key)
-        bucket = self.buckets[hash_value]
+    def _full_hash(self, key: K) -> int:
+        """Hash of key modulo p, before reduction to a bucket index."""
+        if isinstance(key, int):
+            return (self.a * key + self.b) % self.p
+        elif isinstance(key, str):
+            return self._full_hash_str(key)
+        else:
+            return self._composite_hash(key)
+    
+    def _same_family(self, other: "FixedSizeHashMap[K]") -> bool:
+        """True if full hashes stored by other are valid in this table."""
+        return (self.p, self.a, self.b, self.x) == (other.p, other.a, other.b, other.x)
+    
+    def _instrumented_locate(self, key: K, op: str, scanned: int = 0,
+                             record_miss: bool = True) -> Tuple[int, int]:
+        """_locate that also records hashing time and scan length.
         
-        # Check if key already exists
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
-                bucket[i] = (key, value)  # Update value
-                return
+        scanned is the number of entries the operation already compared in
+        another table. With record_miss false a miss is left unrecorded, for
+        a caller that goes on to look in a second table.
+        """
+        stats = self.stats
+        start = time.perf_counter()
+        full_hash = self._full_hash(key)
+        stats.hash_seconds += time.perf_counter() - start
+        stats.hash_calls += 1
         
-        # Key not found, append new key-value pair
-        bucket.append((key, value))
-        self._count += 1
+        bucket = self.buckets[full_hash % self.m]
+        for i, (k, v, h) in enumerate(bucket):
+            if h == full_hash and k == key:
+                stats.record_scan(op, scanned + i + 1)
+                return full_hash, i
+        if record_miss:
+            stats.record_scan(op, scanned + len(bucket))
+        return full_hash, -1
     
-    def get(self, key: K) -> Optional[Any]:
-        hash_value = self._hash(key)
+    def _locate(self, key: K, op: str = "put", scanned: int = 0,
+                record_miss: bool = True) -> Tuple[int, int]:
+        """Return the full hash of key and its position in its bucket (-1 if absent).
+        
+        The remaining arguments only matter to an instrumented table and are
+        passed on to _instrumented_locate.
+        """
+        if self.stats is not None:
+            return self._instrumented_locate(key, op, scanned, record_miss)
+        full_hash = self._full_hash(key)
+        for i, (k, v, h) in enumerate(self.buckets[full_hash % self.m]):
+            if h == full_hash and k == key:
+                return full_hash, i
+        return full_hash, -1
+    
+    def _insert_at(self, full_hash: int, key: K, value: Any) -> None:
+        """Append a key known to be absent, with its full hash, to its bucket."""
+        hash_value = full_hash % self.m
         bucket = self.buckets[hash_value]
+        if bucket:
+            bucket.append((key, value, full_hash))
+        else:
+            self.buckets[hash_value] = [(key, value, full_hash)]
+        self._count += 1
+        self._version += 1
+    
+    def _remove_at(self, full_hash: int, i: int) -> None:
+        """Drop the entry at position i of the bucket for full_hash."""
+        self.buckets[full_hash % self.m].pop(i)
+        self._count -= 1
+        self._version += 1
+    
+    def put(self, key: K, value: Any) -> None:
+        full_hash, i = self._locate(key)
+        if i >= 0:
+            self.buckets[full_hash % self.m][i] = (key, value, full_hash)  # Update value
+        else:
+            self._insert_at(full_hash, key, value)
+    
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        if self.stats is not None:
+            full_hash, i = self._instrumented_locate(key, "get")
+            return self.buckets[full_hash % self.m][i][1] if i >= 0 else default
+        full_hash = self._full_hash(key)
+        bucket = self.buckets[full_hash % self.m]
         
-        for k, v in bucket:
-            if k == key:
+        # Stored hashes settle most mismatches without comparing keys
+        for k, v, h in bucket:
+            if h == full_hash and k == key:
                 return v
         
-        return None
+        return default
+    
+    def _get_hashed(self, full_hash: int, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        """get for a key whose _full_hash the caller has already computed."""
+        if self.stats is not None:
+            return self.get(key, default)
+        for k, v, h in self.buckets[full_hash % self.m]:
+            if h == full_hash and k == key:
+                return v
+        return default
     
     def remove(self, key: K) -> bool:
-        hash_value = self._hash(key)
-        bucket = self.buckets[hash_value]
+        if self.stats is not None:
+            full_hash, i = self._instrumented_locate(key, "remove")
+            if i < 0:
+                return False
+            self._remove_at(full_hash, i)
+            return True
+        full_hash = self._full_hash(key)
+        bucket = self.buckets[full_hash % self.m]
         
-        for i, (k, v) in enumerate(bucket):
-            if k == key:
+        for i, (k, v, h) in enumerate(bucket):
+            if h == full_hash and k == key:
                 bucket.pop(i)
                 self._count -= 1
+                self._version += 1
                 return True
         
         return False
     
     def size(self) -> int:
         return self._count
+    
+    def bucket_histogram(self) -> Dict[int, int]:
+        """Number of buckets of each length."""
+        histogram: Dict[int, int] = {}
+        for bucket in self.buckets:
+            length = len(bucket)
+            histogram[length] = histogram.get(length, 0) + 1
+        return histogram
+    
+    def stats_report(self) -> Dict[str, Any]:
+        """Collected counters (if instrumented) plus the current table shape."""
+        report = self.stats.to_dict() if self.stats is not None else {}
+        report.update({
+            "size": self._count,
+            "buckets": self.m,
+            "load_factor": self._count / self.m,
+            "bucket_histogram": self.bucket_histogram(),
+        })
+        return report
+    
+    def stats_json(self) -> str:
+        return json.dumps(self.stats_report())
+    
+    def memory_usage(self) -> Dict[str, float]:
+        """Bytes used by the table structure, excluding the key and value objects."""
+        buckets = sys.getsizeof(self.buckets)
+        entries = 0
+        for bucket in self.buckets:
+            if bucket:
+                entries += sys.getsizeof(bucket) + sum(sys.getsizeof(entry) for entry in bucket)
+        total = buckets + entries
+        return {
+            "buckets": buckets,
+            "entries": entries,
+            "total": total,
+            "bytes_per_entry": total / self._count if self._count else 0.0,
+        }
+    
+    def _hash_many(self, keys: Sequence[K]) -> Tuple[List[K], List[int]]:
+        """Keys as Python objects plus their full hashes (mod p).
+        
+        Integer keys go through (a*k + b) % p as one NumPy expression and
+        string keys through _poly_hash_many; anything else is hashed one key
+        at a time.
+        """
+        if np is not None and isinstance(keys, np.ndarray) and keys.dtype.kind == "i":
+            key_list = keys.tolist()
+            array = keys.astype(np.int64)
+        else:
+            key_list = list(keys)
+            array = None
+            if np is not None and key_list and all(type(k) is int for k in key_list):
+                array = np.array(key_list)
+                if array.dtype.kind != "i":  # Too large for int64
+                    array = None
+        
+        if array is not None and self.p < 1 << 47:
+            # Reducing k mod p first keeps a*k inside int64
+            hashes = (_mulmod_np(array % self.p, self.a, self.p) + self.b) % self.p
+            return key_list, hashes.tolist()
+        if key_list and all(type(k) is str for k in key_list):
+            return key_list, _poly_hash_many(key_list, self.x, self.p)  # type: ignore
+        return key_list, [self._full_hash(k) for k in key_list]
+    
+    def put_many(self, keys: Sequence[K], values: Sequence[Any]) -> int:
+        """Insert or update many pairs at once; returns the number of new keys."""
+        key_list, hashes = self._hash_many(keys)
+        return self._put_hashed(key_list, hashes, values)
+    
+    def _put_hashed(self, key_list: List[K], hashes: List[int], values: Sequence[Any]) -> int:
+        """put_many for keys whose full hashes _hash_many has already computed."""
+        value_list = _as_list(values)
+        if len(key_list) != len(value_list):
+            raise ValueError("keys and values must have the same length")
+        
+        buckets = self.buckets
+        m = self.m
+        inserted = 0
+        for full_hash, key, value in zip(hashes, key_list, value_list):
+            hash_value = full_hash % m
+            bucket = buckets[hash_value]
+            for i, (k, v, h) in enumerate(bucket):
+                if h == full_hash and k == key:
+                    bucket[i] = (key, value, full_hash)
+                    break
+            else:
+                if bucket:
+                    bucket.append((key, value, full_hash))
+                else:
+                    buckets[hash_value] = [(key, value, full_hash)]
+                inserted += 1
+        self._count += inserted
+        self._version += inserted
+        return inserted
+    
+    def get_many(self, keys: Sequence[K], default: Optional[Any] = None) -> List[Optional[Any]]:
+        """Values of many keys, with default for the absent ones."""
+        key_list, hashes = self._hash_many(keys)
+        buckets = self.buckets
+        m = self.m
+        result: List[Optional[Any]] = []
+        for full_hash, key in zip(hashes, key_list):
+            for k, v, h in buckets[full_hash % m]:
+                if h == full_hash and k == key:
+                    result.append(v)
+                    break
+            else:
+                result.append(default)
+        return result
+    
+    def remove_many(self, keys: Sequence[K]) -> int:
+        """Remove many keys at once; returns how many were present."""
+        key_list, hashes = self._hash_many(keys)
+        buckets = self.buckets
+        m = self.m
+        removed = 0
+        for full_hash, key in zip(hashes, key_list):
+            bucket = buckets[full_hash % m]
+            for i, (k, v, h) in enumerate(bucket):
+                if h == full_hash and k == key:
+                    bucket.pop(i)
+                    removed += 1
+                    break
+        self._count -= removed
+        self._version += removed
+        return removed
+    
+    def _iter_entries(self) -> Iterator[Tuple[K, Any, int]]:
+        """Walk the buckets in place, failing fast if the map gains or loses
+        a key mid-walk. Updating the value of an existing key is allowed."""
+        version = self._version
+        for bucket in self.buckets:
+            for entry in bucket:
+                yield entry
+                if self._version != version:
+                    raise RuntimeError("map changed size during iteration")
+    
+    def keys(self) -> Iterator[K]:
+        for key, value, full_hash in self._iter_entries():
+            yield key
+    
+    def values(self) -> Iterator[Any]:
+        for key, value, full_hash in self._iter_entries():
+            yield value
+    
+    def items(self) -> Iterator[Tuple[K, Any]]:
+        for key, value, full_hash in self._iter_entries():
+            yield key, value
+    
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
 
 
 class ResizableHashMap(Generic[K]):
-    def __init__(self, initial_size: int = 16, load_factor_threshold: float = 0.75):
+    def __init__(self, initial_size: int = 16, load_factor_threshold: float = 0.75,
+                 incremental: bool = False, migrate_buckets: int = 4,
+                 hash_cache_size: int = 0, shrink_threshold: Optional[float] = None,
+                 instrument: bool = False, bloom_bits_per_key: int = 0):
+        # Halving at shrink_threshold lands at twice that load, which must stay
+        # well below the growth threshold or the map would thrash at the edge.
+        # The default of a quarter of the growth threshold always qualifies.
+        if shrink_threshold is None:
+            shrink_threshold = load_factor_threshold / 4
+        elif shrink_threshold * 2 >= load_factor_threshold:
+            raise ValueError("shrink_threshold must be below half of load_factor_threshold")
         self.load_factor_threshold = load_factor_threshold
+        self.shrink_threshold = shrink_threshold
+        self.min_capacity = initial_size
+        # Shrinking stops here; reserve raises it and shrink_to_fit resets it
+        self._capacity_floor = initial_size
         self.count = 0
         self.capacity = initial_size
-        self.map = FixedSizeHashMap[K](initial_size)
+        self.hash_cache_size = hash_cache_size
+        # Shared with every table this map creates, so counters survive resizes
+        self.stats: Optional[HashMapStats] = HashMapStats() if instrument else None
+        # One hash family for all tables while p >= 100 * capacity. Starting
+        # near 2^30 leaves room for growth to ~10M buckets without a redraw,
+        # and lets the string hash cache carry over between tables.
+        self._family = _draw_hash_family(max(initial_size * 100, 1 << 30))
+        self.map = self._new_table(initial_size)
+        
+        # Incremental mode: during a resize the previous table stays alive in
+        # old_map and every operation moves at least migrate_buckets buckets
+        # across.
+        self.incremental = incremental
+        self.migrate_buckets = max(2, migrate_buckets)
+        self.old_map: Optional[FixedSizeHashMap[K]] = None
+        self._migrate_pos = 0
+        self._migrate_batch = self.migrate_buckets
+        
+        # Optional Bloom filter consulted before get/remove touch a bucket,
+        # keyed on full hashes of the current family. It only ever gains
+        # bits, so it is rebuilt whenever the table is; during an incremental
+        # resize the old filter keeps covering old_map, under old_map's family.
+        self.bloom_bits_per_key = bloom_bits_per_key
+        self.bloom: Optional[BloomFilter] = None
+        self._old_bloom: Optional[BloomFilter] = None
+        if bloom_bits_per_key > 0:
+            self.bloom = self._new_bloom(initial_size)
     
-    def put(self, key: K, value: Any) -> None:
-        # Check if key already exists
-        old_value = self.map.get(key)
-        if old_value is not None:
-            self.map.put(key, value)
-            return
+    def _new_table(self, capacity: int) -> FixedSizeHashMap[K]:
+        reuse = self._family[0] >= capacity * 100
+        if not reuse:
+            self._family = _draw_hash_family(capacity * 100)
+        table = FixedSizeHashMap[K](capacity, self.hash_cache_size, hash_family=self._family)
+        table.stats = self.stats
+        if reuse and self.hash_cache_size > 0 and hasattr(self, "map"):
+            table._str_hash_cache = self.map._str_hash_cache  # Still valid: same x and p
+        return table
+    
+    def _locate_any(self, key: K, op: str) -> Tuple[FixedSizeHashMap[K], int, int]:
+        """Look for key in old_map, then in map, recording one scan for op.
+        
+        Returns (table, full hash, position); on a miss the table is self.map
+        and the position -1.
+        """
+        old_map = self.old_map
+        scanned = 0
+        if old_map is not None:
+            full_hash, i = old_map._locate(key, op, record_miss=False)
+            if i >= 0:
+                return old_map, full_hash, i
+            if self.stats is not None:
+                scanned = len(old_map.buckets[full_hash % old_map.m])
+        full_hash, i = self.map._locate(key, op, scanned)
+        return self.map, full_hash, i
+    
+    def _find_slot(self, key: K, op: str) -> Tuple[FixedSizeHashMap[K], int, int]:
+        """Locate key for the write op with a single hash and bucket scan.
+        
+        Returns (table, full hash, position). When the key is absent the
+        position is -1 and the hash is valid for self.map, which has already
+        been resized if the insert would exceed the load factor.
+        """
+        if self.old_map is not None:
+            self._migrate_step()
+        table, full_hash, i = self._locate_any(key, op)
+        if i >= 0:
+            return table, full_hash, i
         
         # New key, check load factor
         current_load_factor = (self.count + 1) / self.capacity
         if current_load_factor > self.load_factor_threshold:
             self._resize()
-        
-        self.map.put(key, value)
+            full_hash = self.map._full_hash(key)  # The family may have been redrawn
+        if self.bloom is not None:
+            self.bloom.add_hash(full_hash)  # The caller inserts it next
+        return self.map, full_hash, -1
+    
+    def put(self, key: K, value: Any) -> None:
+        table, full_hash, i = self._find_slot(key, "put")
+        if i >= 0:
+            table.buckets[full_hash % table.m][i] = (key, value, full_hash)
+            return
+        table._insert_at(full_hash, key, value)
+        self.count += 1
+    
+    def setdefault(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the value of key, inserting default first if it is absent."""
+        table, full_hash, i = self._find_slot(key, "setdefault")
+        if i >= 0:
+            return table.buckets[full_hash % table.m][i][1]
+        table._insert_at(full_hash, key, default)
         self.count += 1
+        return default
     
-    def _resize(self) -> None:
+    def get_or_insert(self, key: K, factory: Callable[[], Any]) -> Any:
+        """Like setdefault, but only builds the default when key is absent."""
+        return self._get_or_insert(key, factory, "get_or_insert")
+    
+    def _get_or_insert(self, key: K, factory: Callable[[], Any], op: str) -> Any:
+        table, full_hash, i = self._find_slot(key, op)
+        if i >= 0:
+            return table.buckets[full_hash % table.m][i][1]
+        value = factory()
+        table._insert_at(full_hash, key, value)
+        self.count += 1
+        return value
+    
+    def update_with(self, key: K, fn: Callable[[Any], Any], default: Optional[Any] = None) -> Any:
+        """Store fn(current value) under key, using default when key is absent."""
+        table, full_hash, i = self._find_slot(key, "update_with")
+        if i >= 0:
+            bucket = table.buckets[full_hash % table.m]
+            value = fn(bucket[i][1])
+            bucket[i] = (key, value, full_hash)
+            return value
+        value = fn(default)
+        table._insert_at(full_hash, key, value)
+        self.count += 1
+        return value
+    
+    def _resize(self, new_capacity: Optional[int] = None) -> None:
+        if new_capacity is None:
+            new_capacity = self.capacity * 2
+        if self.incremental:
+            self._start_incremental_resize(new_capacity)
+            return
+        self._rebuild(new_capacity)
+    
+    def _maybe_shrink(self) -> None:
+        # Starting a shrink mid-migration would drain the rest of old_map in
+        # one call; the next removal after the migration checks again.
+        if self.old_map is not None:
+            return
+        if (self.count < self.shrink_threshold * self.capacity
+                and self.capacity // 2 >= self._capacity_floor):
+            self._resize(self.capacity // 2)
+    
+    def _fit_capacity(self, n: int) -> int:
+        """Smallest capacity of the form min_capacity * 2^k that holds n entries."""
+        capacity = self.min_capacity
+        while n / capacity > self.load_factor_threshold:
+            capacity *= 2
+        return capacity
+    
+    def _presize(self, n: int) -> None:
+        """Grow once so that n entries fit without further resizes."""
+        new_capacity = self._fit_capacity(n)
+        if new_capacity > self.capacity:
+            self._rebuild(new_capacity)
+    
+    def reserve(self, n: int) -> None:
+        """Grow once so that n entries fit, and keep that capacity through
+        removals until shrink_to_fit is called."""
+        new_capacity = self._fit_capacity(n)
+        if new_capacity > self.capacity:
+            self._rebuild(new_capacity)
+        self._capacity_floor = max(self._capacity_floor, new_capacity)
+    
+    def shrink_to_fit(self) -> None:
+        """Rebuild into the smallest capacity that still holds every entry,
+        dropping any capacity kept by reserve."""
+        self._capacity_floor = self.min_capacity
+        new_capacity = self._fit_capacity(self.count)
+        if new_capacity < self.capacity:
+            self._rebuild(new_capacity)
+    
+    def _rebuild(self, new_capacity: int) -> None:
+        """Move every entry into a new table of new_capacity buckets at once."""
+        self._drain()
+        start = time.perf_counter()
         old_map = self.map
-        new_capacity = self.capacity * 2
-        new_map = FixedSizeHashMap[K](new_capacity)
+        new_map = self._new_table(new_capacity)
+        bloom = self._new_bloom(new_capacity)
         
-        # Rehash all entries
+        # Keys are unique so no bucket scan is needed, and while the family
+        # is unchanged the stored hashes are reused instead of rehashing
+        rehash = not new_map._same_family(old_map)
         for bucket in old_map.buckets:
-            for key, value in bucket:
-                new_map.put(key, value)
+            for key, value, full_hash in bucket:
+                if rehash:
+                    full_hash = new_map._full_hash(key)
+                new_map._insert_at(full_hash, key, value)
+                if bloom is not None:
+                    bloom.add_hash(full_hash)
         
         self.map = new_map
         self.capacity = new_capacity
+        self.bloom = bloom
+        if self.stats is not None:
+            self.stats.resizes += 1
+            self.stats.resize_seconds += time.perf_counter() - start
     
-    def get(self, key: K) -> Optional[Any]:
-        return self.map.get(key)
+    def _drain(self) -> None:
+        """Finish any incremental migration in progress."""
+        while self.old_map is not None:
+            self._migrate_step()
+    
+    def _start_incremental_resize(self, new_capacity: int) -> None:
+        # A resize can only start once the previous one has drained
+        self._drain()
+        
+        start = time.perf_counter()
+        self.old_map = self.map
+        self.capacity = new_capacity
+        self.map = self._new_table(self.capacity)
+        self._migrate_pos = 0
+        # Move enough buckets per operation that old_map is empty before the
+        # count can cross the next growth or shrink threshold, so a resize
+        # never has to drain the one before it
+        headroom = min(self.count - int(self.shrink_threshold * new_capacity),
+                       int(self.load_factor_threshold * new_capacity) - self.count)
+        self._migrate_batch = max(self.migrate_buckets, -(-self.old_map.m // max(1, headroom)))
+        # The new filter fills up as buckets migrate, while the old one keeps
+        # covering old_map until the migration finishes
+        self._old_bloom = self.bloom
+        self.bloom = self._new_bloom(self.capacity)
+        if self.stats is not None:
+            self.stats.resizes += 1
+            self.stats.resize_seconds += time.perf_counter() - start
+    
+    def _migrate_step(self) -> None:
+        """Move the next batch of buckets from old_map into map."""
+        old_map = self.old_map
+        if old_map is None:
+            return
+        start = time.perf_counter()
+        
+        end = min(self._migrate_pos + self._migrate_batch, old_map.m)
+        bloom = self.bloom
+        rehash = not self.map._same_family(old_map)
+        for i in range(self._migrate_pos, end):
+            bucket = old_map.buckets[i]
+            if bucket:
+                for key, value, full_hash in bucket:
+                    if rehash:
+                        full_hash = self.map._full_hash(key)
+                    self.map._insert_at(full_hash, key, value)
+                    if bloom is not None:
+                        bloom.add_hash(full_hash)
+                old_map._count -= len(bucket)
+                old_map.buckets[i] = ()  # type: ignore
+        self._migrate_pos = end
+        
+        if end == old_map.m:
+            self.old_map = None
+            self._old_bloom = None
+        if self.stats is not None:
+            self.stats.resize_seconds += time.perf_counter() - start
+    
+    def is_resizing(self) -> bool:
+        return self.old_map is not None
+    
+    def _new_bloom(self, capacity: int) -> Optional[BloomFilter]:
+        if self.bloom_bits_per_key <= 0:
+            return None
+        # Sized for the most entries the table holds before it grows again
+        expected = int(capacity * self.load_factor_threshold) + 1
+        return BloomFilter(expected, self.bloom_bits_per_key, self._family[0])
+    
+    def _bloom_rejects(self, key: K, full_hash: int) -> bool:
+        """True if the Bloom filters prove key, with this full hash in map, absent."""
+        bloom = self.bloom
+        if bloom.might_contain_hash(full_hash):
+            return False
+        old_bloom = self._old_bloom
+        if old_bloom is not None:
+            # A redrawn family leaves the old filter keyed on old_map's hashes
+            old_map = self.old_map
+            if not self.map._same_family(old_map):
+                full_hash = old_map._full_hash(key)
+            if old_bloom.might_contain_hash(full_hash):
+                return False
+        bloom.rejections += 1
+        return True
+    
+    def _get_after_filter(self, full_hash: int, key: K, default: Optional[Any]) -> Optional[Any]:
+        if self.old_map is None:
+            value = self.map._get_hashed(full_hash, key, _MISSING)
+        else:
+            self._migrate_step()
+            table, full_hash, i = self._locate_any(key, "get")
+            value = table.buckets[full_hash % table.m][i][1] if i >= 0 else _MISSING
+        if value is _MISSING:
+            self.bloom.false_positives += 1
+            return default
+        return value
+    
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        if self.bloom is not None:
+            full_hash = self.map._full_hash(key)
+            if self._bloom_rejects(key, full_hash):
+                return default
+            return self._get_after_filter(full_hash, key, default)
+        if self.old_map is not None:
+            self._migrate_step()
+            if self.old_map is not None:
+                table, full_hash, i = self._locate_any(key, "get")
+                return table.buckets[full_hash % table.m][i][1] if i >= 0 else default
+        return self.map.get(key, default)
     
     def remove(self, key: K) -> bool:
-        if self.map.remove(key):
+        if self.bloom is not None and self._bloom_rejects(key, self.map._full_hash(key)):
+            return False
+        if self.old_map is not None:
+            self._migrate_step()
+        if self.old_map is not None:
+            table, full_hash, i = self._locate_any(key, "remove")
+            removed = i >= 0
+            if removed:
+                table._remove_at(full_hash, i)
+        else:
+            removed = self.map.remove(key)
+        if removed:
             self.count -= 1
-            return True
-        return False
+            self._maybe_shrink()
+        elif self.bloom is not None:
+            self.bloom.false_positives += 1
+        return removed
     
     def size(self) -> int:
         return self.count
+    
+    def _iter_entries(self) -> Iterator[Tuple[K, Any, int]]:
+        # Lookups move buckets while a migration runs, so finish it first;
+        # any resize after that swaps self.map and counts as a modification.
+        self._drain()
+        table = self.map
+        version = table._version
+        for bucket in table.buckets:
+            for entry in bucket:
+                yield entry
+                if self.map is not table or table._version != version:
+                    raise RuntimeError("map changed size during iteration")
+    
+    def keys(self) -> Iterator[K]:
+        for key, value, full_hash in self._iter_entries():
+            yield key
+    
+    def values(self) -> Iterator[Any]:
+        for key, value, full_hash in self._iter_entries():
+            yield value
+    
+    def items(self) -> Iterator[Tuple[K, Any]]:
+        for key, value, full_hash in self._iter_entries():
+            yield key, value
+    
+    def __iter__(self) -> Iterator[K]:
+        return self.keys()
+    
+    def stats_report(self) -> Dict[str, Any]:
+        """Counters (if instrumented) and bucket histogram of the current table."""
+        report = self.map.stats_report()
+        report["resizing"] = self.old_map is not None
+        if self.bloom is not None:
+            report["bloom"] = self.bloom.to_dict()
+        return report
+    
+    def stats_json(self) -> str:
+        return json.dumps(self.stats_report())
+    
+    def put_many(self, keys: Sequence[K], values: Sequence[Any]) -> None:
+        """Insert or update many pairs, resizing at most once up front."""
+        self._drain()
+        # Presize for the worst case in which every key is new
+        self._presize(self.count + len(keys))
+        key_list, hashes = self.map._hash_many(keys)
+        # Fill the filter first so a failed insert can only leave extra bits
+        if self.bloom is not None:
+            for full_hash in hashes:
+                self.bloom.add_hash(full_hash)
+        self.count += self.map._put_hashed(key_list, hashes, values)
+    
+    def get_many(self, keys: Sequence[K], default: Optional[Any] = None) -> List[Optional[Any]]:
+        self._drain()
+        return self.map.get_many(keys, default)
+    
+    def remove_many(self, keys: Sequence[K]) -> int:
+        self._drain()
+        removed = self.map.remove_many(keys)
+        self.count -= removed
+        # Shrink once for the whole batch, to the capacity that halving
+        # removal by removal would reach, so the load stays at most twice
+        # shrink_threshold
+        new_capacity = self.capacity
+        while (self.count < self.shrink_threshold * new_capacity
+               and new_capacity // 2 >= self._capacity_floor):
+            new_capacity //= 2
+        if new_capacity < self.capacity:
+            self._rebuild(new_capacity)
+        return removed
 
-""" 
-if __name__ == "__main__":
-    sizes = [1000, 10000, 100000, 1000000]
-    trials = 5
-    times = []
-    times2 = []
+
+class _OrderNode:
+    """Value slot of an OrderedHashMap entry, linked in insertion order."""
     
-    for size in sizes:
-        fhm_times = []
-        rhm_times = []
-        
-        for _ in range(trials):
-            random.seed(42)  # Ensure the same random values for both hash maps
-            
-            # FixedSizeHashMap timing
-            start = time.time()
-            fhm = FixedSizeHashMap(size)
-            for i in range(size):
-                fhm.put(random.randint(0, size - 1), random.randint(0, size - 1))
-            end = time.time()
-            fhm_times.append(end - start)
-            
-            random.seed(42)  
-            # ResizableHashMap timing
-            start = time.time()
-            rhm = ResizableHashMap()
-            for i in range(size):
-                rhm.put(random.randint(0, size - 1), random.randint(0, size - 1))
-            end = time.time()
-            rhm_times.append(end - start)
-        
-        times.append(sum(fhm_times) / trials)
-        times2.append(sum(rhm_times) / trials)
-    
-    plt.plot(sizes, times2, marker='o', linestyle='-', label="Resizable Hash Map")
-    plt.plot(sizes, times, marker='o', linestyle='-', label="Fixed Size Hash Map")
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.grid(True, which="both", linestyle="--", alpha=0.7)
-    plt.xlabel("Size (n), Load Factor = 0.75")
-    plt.ylabel("Total Time (s)")
-    plt.legend()
-    plt.show()
-"""
-"""
-if __name__ == "__main__":
-    sizes = [1000, 10000, 100000, 1000000]
-    trials = 1
-    load_factors = [0.1, 0.25, 0.5, 0.75, 0.9, 1.2, 1.5]
-    times = {lf: [] for lf in load_factors}
-
-    for size in sizes:
-        rhm_times = {lf: [] for lf in load_factors}
-
-        for _ in range(trials):
-            for lf in load_factors:
-                random.seed(42)  # Reset the seed for consistent values
-
-                # ResizableHashMap timing
-                start = time.time()
-                rhm = ResizableHashMap(load_factor_threshold=lf)
-                for i in range(size):
-                    rhm.put(random.randint(0, size - 1), random.randint(0, size - 1))
-                end = time.time()
-                rhm_times[lf].append(end - start)
-
-        for lf in load_factors:
-            times[lf].append(sum(rhm_times[lf]) / trials)
-
-    for lf in load_factors:
-        plt.plot(sizes, times[lf], marker='o', linestyle='-', label=f"Resizable Hash Map (Load Factor = {lf})")
-    
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.grid(True, which="both", linestyle="--", alpha=0.7)
-    plt.xlabel("Size (n)")
-    plt.ylabel("Total Time (s)")
-    plt.legend()
-    plt.show()
-"""
-if __name__ == "__main__":
-    sizes = [1000, 10000, 100000, 1000000]
-    trials = 1
-    initial_sizes = [0.5, 0.75, 1.0, 1.5]  # Multipliers for the initial size
-    times = {isize: [] for isize in initial_sizes}
-
-    for size in sizes:
-        fhm_times = {isize: [] for isize in initial_sizes}
-
-        for _ in range(trials):
-            random.seed(42)  # Ensure the same random values for all hash maps
-
-            for isize in initial_sizes:
-                m = int(size * isize)
-                start = time.time()
-                fhm = FixedSizeHashMap(m)
-                for i in range(size):
-                    fhm.put(random.randint(0, size - 1), random.randint(0, size - 1))
-                end = time.time()
-                fhm_times[isize].append(end - start)
-
-        for isize in initial_sizes:
-            times[isize].append(sum(fhm_times[isize]) / trials)
-
-    for isize in initial_sizes:
-        plt.plot(sizes, times[isize], marker='o', linestyle='-', label=f"Fixed Size Hash Map (m = {isize} * size)")
-    
-    plt.xscale("log")
-    plt.yscale("log")
-    plt.grid(True, which="both", linestyle="--", alpha=0.7)
-    plt.xlabel("Size (n)")
-    plt.ylabel("Total Time (s)")
-    plt.legend()
-    plt.show()
+    __slots__ = ("key", "value", "prev", "next")
+    
+    def __init__(self, key: Any, value: Any):
+        self.key = key
+        self.value = value
+        self.prev: Optional[_OrderNode] = None
+        self.next: Optional[_OrderNode] = None
+
+
+class OrderedHashMap(ResizableHashMap[K]):
+    """ResizableHashMap whose views yield entries in insertion order.
+    
+    Each stored value is an _OrderNode threaded on a doubly linked list, the
+    same intrusive layout the caches use, so removal unlinks in O(1) and a
+    scan follows the list instead of the buckets. Updating a key keeps its
+    position; removing and reinserting it moves it to the end.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.head: Optional[_OrderNode] = None
+        self.tail: Optional[_OrderNode] = None
+        self._order_version = 0
+    
+    def _link(self, key: K, value: Any) -> _OrderNode:
+        node = _OrderNode(key, value)
+        node.prev = self.tail
+        if self.tail:
+            self.tail.next = node
+        else:
+            self.head = node
+        self.tail = node
+        self._order_version += 1
+        return node
+    
+    def _unlink(self, node: _OrderNode) -> None:
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self._order_version += 1
+    
+    def put(self, key: K, value: Any) -> None:
+        node = self._get_or_insert(key, lambda: self._link(key, value), "put")
+        node.value = value
+    
+    def setdefault(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        return self._get_or_insert(key, lambda: self._link(key, default), "setdefault").value
+    
+    def get_or_insert(self, key: K, factory: Callable[[], Any]) -> Any:
+        return self._get_or_insert(key, lambda: self._link(key, factory()), "get_or_insert").value
+    
+    def update_with(self, key: K, fn: Callable[[Any], Any], default: Optional[Any] = None) -> Any:
+        node = super().get(key)
+        if node is None:
+            value = fn(default)
+            self.put(key, value)
+            return value
+        node.value = fn(node.value)
+        return node.value
+    
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        node = super().get(key)
+        return default if node is None else node.value
+    
+    def remove(self, key: K) -> bool:
+        node = super().get(key)
+        if node is None:
+            return False
+        self._unlink(node)
+        return super().remove(key)
+    
+    def put_many(self, keys: Sequence[K], values: Sequence[Any]) -> None:
+        key_list, value_list = _as_list(keys), _as_list(values)
+        if len(key_list) != len(value_list):
+            raise ValueError("keys and values must have the same length")
+        self._drain()
+        self._presize(self.count + len(key_list))
+        for key, value in zip(key_list, value_list):
+            self.put(key, value)
+    
+    def get_many(self, keys: Sequence[K], default: Optional[Any] = None) -> List[Optional[Any]]:
+        return [default if node is None else node.value for node in super().get_many(keys)]
+    
+    def remove_many(self, keys: Sequence[K]) -> int:
+        return sum(1 for key in _as_list(keys) if self.remove(key))
+    
+    def _iter_nodes(self) -> Iterator[_OrderNode]:
+        version = self._order_version
+        node = self.head
+        while node is not None:
+            following = node.next
+            yield node
+            if self._order_version != version:
+                raise RuntimeError("map changed size during iteration")
+            node = following
+    
+    def keys(self) -> Iterator[K]:
+        for node in self._iter_nodes():
+            yield node.key
+    
+    def values(self) -> Iterator[Any]:
+        for node in self._iter_nodes():
+            yield node.value
+    
+    def items(self) -> Iterator[Tuple[K, Any]]:
+        for node in self._iter_nodes():
+            yield node.key, node.value
@@ -0,0 +1,117 @@
+import gc
+import multiprocessing
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from hash_tables import K, np, FixedSizeHashMap
+
+# Input of the build, set in each worker by _init_build_worker. With the fork
+# start method it is inherited from the parent instead of being pickled.
+_build_input: Optional[Tuple[List[Any], List[Any], List[int]]] = None
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Suspend cyclic GC while building millions of acyclic bucket lists and
+    tuples; otherwise its collections cost more than the build itself."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _init_build_worker(keys: List[Any], values: List[Any], hashes: List[int]) -> None:
+    """hashes are full hashes (mod p); the bucket of pair i is hashes[i] % m."""
+    global _build_input
+    _build_input = (keys, values, hashes)
+
+
+def _build_range(lo: int, hi: int, m: int, indices: Sequence[int]) -> Tuple[List[Any], int]:
+    """Buckets lo..hi-1 of the final table, filled from the pairs at indices.
+
+    Indices arrive in input order, so a repeated key keeps its last value
+    like it would with put.
+    """
+    keys, values, hashes = _build_input
+    buckets: List[Any] = [()] * (hi - lo)
+    with _gc_paused():
+        _fill_range(buckets, lo, m, indices, keys, values, hashes)
+    return buckets, sum(len(bucket) for bucket in buckets)
+
+
+def _fill_range(buckets: List[Any], lo: int, m: int, indices: Sequence[int],
+                keys: List[Any], values: List[Any], hashes: List[int]) -> None:
+    for i in indices:
+        key = keys[i]
+        full_hash = hashes[i]
+        b = full_hash % m - lo
+        bucket = buckets[b]
+        if not bucket:
+            buckets[b] = [(key, values[i], full_hash)]
+            continue
+        for j, (k, v, h) in enumerate(bucket):
+            if h == full_hash and k == key:
+                bucket[j] = (key, values[i], full_hash)  # Update value
+                break
+        else:
+            bucket.append((key, values[i], full_hash))
+
+
+def _partition(hashes: List[int], m: int, workers: int) -> List[List[int]]:
+    """Input positions per worker; worker w owns the buckets with b * workers // m == w."""
+    if np is not None:
+        owner = np.asarray(hashes, dtype=np.int64) % m * workers // m
+        order = np.argsort(owner, kind="stable")  # Stable keeps input order per range
+        bounds = np.cumsum(np.bincount(owner, minlength=workers))[:-1]
+        return [part.tolist() for part in np.split(order, bounds)]
+    parts: List[List[int]] = [[] for _ in range(workers)]
+    for i, h in enumerate(hashes):
+        parts[h % m * workers // m].append(i)
+    return parts
+
+
+def build_parallel(pairs: Sequence[Tuple[K, Any]], workers: Optional[int] = None,
+                   m: Optional[int] = None) -> FixedSizeHashMap[K]:
+    """Build a FixedSizeHashMap from (key, value) pairs using a process pool.
+
+    The parent hashes every key once (vectorized when NumPy is available)
+    and splits the pairs by bucket range. Each worker fills the buckets of
+    its own range, so merging is just concatenating the returned bucket
+    lists. m defaults to one bucket per pair.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if m is None:
+        m = max(1, len(pairs))
+    workers = max(1, min(workers, m))
+
+    table = FixedSizeHashMap[K](m)
+    keys, hashes = table._hash_many([key for key, value in pairs])
+    values = [value for key, value in pairs]
+    parts = _partition(hashes, m, workers)
+    ranges = [(-(-w * m // workers), -(-(w + 1) * m // workers)) for w in range(workers)]
+    tasks = [(lo, hi, m, part) for (lo, hi), part in zip(ranges, parts)]
+
+    if workers == 1:
+        _init_build_worker(keys, values, hashes)
+        try:
+            results = [_build_range(*tasks[0])]
+        finally:
+            _init_build_worker(None, None, None)  # type: ignore
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        with ctx.Pool(workers, _init_build_worker, (keys, values, hashes)) as pool:
+            with _gc_paused():  # Unpickling the returned buckets is a bulk build too
+                results = pool.starmap(_build_range, tasks)
+
+    buckets: List[Any] = []
+    for part_buckets, count in results:
+        buckets.extend(part_buckets)
+        table._count += count
+    table.buckets = buckets
+    return table
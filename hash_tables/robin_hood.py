@@ -0,0 +1,152 @@
+from typing import Any, List, Optional, Generic
+
+from hash_tables import K, _draw_hash_family, _full_hash
+
+_EMPTY = -1  # Marks a free slot in the hash column
+
+
+class RobinHoodHashMap(Generic[K]):
+    """Open-addressing hash map with Robin Hood linear probing.
+
+    Entries live in three flat columns (hashes, keys, values) instead of
+    per-bucket lists. Each slot remembers the full hash (mod p) of its key,
+    so probe distances and resizes never need to rehash the key.
+    """
+
+    def __init__(self, m: int = 16, load_factor_threshold: float = 0.9):
+        if not 0 < load_factor_threshold < 1:
+            raise ValueError("load_factor_threshold must be between 0 and 1")
+        self.m = m
+        self.load_factor_threshold = load_factor_threshold
+        self._count = 0
+        self._hashes: List[int] = [_EMPTY] * m
+        self._keys: List[Optional[K]] = [None] * m
+        self._values: List[Any] = [None] * m
+        self._init_hash_params(m)
+
+    def _init_hash_params(self, m: int) -> None:
+        # Same universal family as FixedSizeHashMap: (ax + b) mod p and a
+        # polynomial hash in x for strings.
+        self.p, self.a, self.b, self.x = _draw_hash_family(m * 100)
+
+    def _hash(self, key: K) -> int:
+        """Full hash of the key modulo p; the home slot is this value mod m."""
+        return _full_hash(key, self.p, self.a, self.b, self.x)
+
+    def _find(self, key: K, h: int) -> int:
+        """Return the slot holding key, or -1 if it is absent."""
+        m = self.m
+        hashes = self._hashes
+        i = h % m
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                return -1
+            if slot_hash == h and self._keys[i] == key:
+                return i
+            # A resident closer to its home than we are means key is absent
+            if (i - slot_hash % m) % m < dist:
+                return -1
+            i += 1
+            if i == m:
+                i = 0
+            dist += 1
+
+    def _insert_new(self, h: int, key: K, value: Any) -> None:
+        """Place an entry known to be absent, displacing richer residents."""
+        m = self.m
+        hashes, keys, values = self._hashes, self._keys, self._values
+        i = h % m
+        dist = 0
+        while True:
+            slot_hash = hashes[i]
+            if slot_hash == _EMPTY:
+                hashes[i], keys[i], values[i] = h, key, value
+                self._count += 1
+                return
+            slot_dist = (i - slot_hash % m) % m
+            if slot_dist < dist:
+                hashes[i], h = h, slot_hash
+                keys[i], key = key, keys[i]
+                values[i], value = value, values[i]
+                dist = slot_dist
+            i += 1
+            if i == m:
+                i = 0
+            dist += 1
+
+    def _resize(self, new_m: int) -> None:
+        old_hashes, old_keys, old_values = self._hashes, self._keys, self._values
+        rehash = new_m * 100 > self.p
+        if rehash:
+            self._init_hash_params(new_m)
+
+        self.m = new_m
+        self._count = 0
+        self._hashes = [_EMPTY] * new_m
+        self._keys = [None] * new_m
+        self._values = [None] * new_m
+
+        for h, key, value in zip(old_hashes, old_keys, old_values):
+            if h != _EMPTY:
+                self._insert_new(self._hash(key) if rehash else h, key, value)
+
+    def put(self, key: K, value: Any) -> None:
+        h = self._hash(key)
+        i = self._find(key, h)
+        if i != -1:
+            self._values[i] = value  # Update value
+            return
+
+        if self._count + 1 > self.m * self.load_factor_threshold:
+            self._resize(self.m * 2)
+            h = self._hash(key)  # The hash parameters may have been redrawn
+        self._insert_new(h, key, value)
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        i = self._find(key, self._hash(key))
+        if i == -1:
+            return default
+        return self._values[i]
+
+    def remove(self, key: K) -> bool:
+        i = self._find(key, self._hash(key))
+        if i == -1:
+            return False
+
+        # Backward-shift deletion: pull the following run one slot closer to
+        # home until we hit a free slot or an entry already at its home.
+        m = self.m
+        hashes, keys, values = self._hashes, self._keys, self._values
+        j = i + 1 if i + 1 < m else 0
+        while hashes[j] != _EMPTY and (j - hashes[j] % m) % m > 0:
+            hashes[i], keys[i], values[i] = hashes[j], keys[j], values[j]
+            i = j
+            j = j + 1 if j + 1 < m else 0
+        hashes[i], keys[i], values[i] = _EMPTY, None, None
+        self._count -= 1
+        return True
+
+    def size(self) -> int:
+        return self._count
+
+    def average_probe_length(self) -> float:
+        """Average number of slots inspected by a successful lookup."""
+        if self._count == 0:
+            return 0.0
+        m = self.m
+        total = 0
+        for i, h in enumerate(self._hashes):
+            if h != _EMPTY:
+                total += (i - h % m) % m + 1
+        return total / self._count
+
+    def max_probe_length(self) -> int:
+        """Longest probe sequence over all stored keys."""
+        m = self.m
+        longest = 0
+        for i, h in enumerate(self._hashes):
+            if h != _EMPTY:
+                longest = max(longest, (i - h % m) % m + 1)
+        return longest
@@ -0,0 +1,56 @@
+import threading
+from typing import Any, Callable, List, Optional, Generic
+
+from hash_tables import K, FixedSizeHashMap, ResizableHashMap
+
+
+class ShardedHashMap(Generic[K]):
+    """Thread-safe hash map split into independently locked, resizable shards.
+
+    A key is routed to a shard by its own universal hash (independent of the
+    parameters each shard uses internally), so a shard can resize while
+    holding only its own lock and operations on other shards keep going.
+    The callables passed to compute_if_absent must not call back into the
+    same map.
+    """
+
+    def __init__(self, shards: int = 16, initial_size: int = 16,
+                 load_factor_threshold: float = 0.75):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.shards: List[ResizableHashMap[K]] = [
+            ResizableHashMap[K](initial_size, load_factor_threshold) for _ in range(shards)]
+        self.locks = [threading.Lock() for _ in range(shards)]
+
+        # Only its hash function is used: a fresh draw from the universal
+        # family with one bucket per shard.
+        self._router = FixedSizeHashMap[K](shards)
+
+    def _shard_index(self, key: K) -> int:
+        return self._router._hash(key)
+
+    def put(self, key: K, value: Any) -> None:
+        i = self._shard_index(key)
+        with self.locks[i]:
+            self.shards[i].put(key, value)
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        i = self._shard_index(key)
+        with self.locks[i]:
+            return self.shards[i].get(key, default)
+
+    def remove(self, key: K) -> bool:
+        i = self._shard_index(key)
+        with self.locks[i]:
+            return self.shards[i].remove(key)
+
+    def compute_if_absent(self, key: K, fn: Callable[[K], Any]) -> Any:
+        """Return the value of key, atomically storing fn(key) first if absent."""
+        i = self._shard_index(key)
+        with self.locks[i]:
+            return self.shards[i].get_or_insert(key, lambda: fn(key))
+
+    def size(self) -> int:
+        # Each shard count is read atomically; the total is a snapshot that
+        # may interleave with concurrent writers.
+        return sum(shard.size() for shard in self.shards)
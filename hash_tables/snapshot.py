@@ -0,0 +1,172 @@
+import mmap
+import os
+import pickle
+import struct
+from array import array
+from typing import Any, List, Optional, Tuple, Union, Generic
+
+from hash_tables import (K, FixedSizeHashMap, OrderedHashMap, ResizableHashMap, _compared_fields,
+                         _full_hash, _is_dataclass_key)
+
+# File layout (little endian):
+#   header   MAGIC, then m, count, p, a, b, x as uint64
+#   offsets  m + 1 uint64 file offsets; bucket i spans offsets[i]..offsets[i+1]
+#   entries  per entry: key tag (uint8), key length (uint32), key bytes,
+#            value length (uint32), pickled value
+MAGIC = b"HMSNAP1\0"
+_HEADER = struct.Struct("<8s6Q")
+_ENTRY_PREFIX = struct.Struct("<BI")
+_LENGTH = struct.Struct("<I")
+_BOUNDS = struct.Struct("<2Q")
+
+_INT_KEY = 0
+_STR_KEY = 1
+_BYTES_KEY = 2
+_FLOAT_KEY = 3
+_TUPLE_KEY = 4
+_FROZENSET_KEY = 5
+_DATACLASS_KEY = 6
+
+
+def _encode_parts(parts: List[Tuple[int, bytes]]) -> bytes:
+    return b"".join(_ENTRY_PREFIX.pack(tag, len(data)) + data for tag, data in parts)
+
+
+def _encode_key(key: K) -> Tuple[int, bytes]:
+    """Tag and bytes of key; keys that compare equal encode identically.
+    
+    Lookups compare these bytes instead of decoding stored keys, so a float
+    equal to an int is stored as that int, frozenset members are sorted by
+    encoding, and a frozen dataclass is its class name followed by the
+    fields it compares by.
+    """
+    if isinstance(key, int):
+        return _INT_KEY, key.to_bytes((key.bit_length() + 8) // 8, "little", signed=True)
+    elif isinstance(key, str):
+        return _STR_KEY, key.encode("utf-8", "surrogatepass")
+    elif isinstance(key, bytes):
+        return _BYTES_KEY, key
+    elif isinstance(key, float):
+        if key.is_integer():
+            return _encode_key(int(key))
+        return _FLOAT_KEY, struct.pack("<d", key)
+    elif isinstance(key, tuple):
+        return _TUPLE_KEY, _encode_parts([_encode_key(item) for item in key])
+    elif isinstance(key, frozenset):
+        return _FROZENSET_KEY, _encode_parts(sorted(_encode_key(item) for item in key))
+    elif _is_dataclass_key(key):
+        cls = type(key)
+        parts = [_encode_key(f"{cls.__module__}.{cls.__qualname__}")]
+        parts.extend(_encode_key(getattr(key, name)) for name in _compared_fields(key))
+        return _DATACLASS_KEY, _encode_parts(parts)
+    else:
+        raise TypeError("Key must be an int, str, bytes, float, tuple, frozenset "
+                        "or frozen dataclass (with eq) of those")
+
+
+def save_snapshot(hm: Union[FixedSizeHashMap[K], ResizableHashMap[K]], path: str) -> None:
+    """Write the hash parameters and buckets of hm to path.
+
+    Buckets are stored in table order, so a reader that knows (a, b, p, x, m)
+    can jump straight to the bucket of a key without rebuilding anything.
+    The file is written under a temporary name and moved into place at the
+    end, so a key or value that cannot be stored leaves path untouched.
+    An OrderedHashMap is stored by value; the snapshot drops its order.
+    """
+    if isinstance(hm, ResizableHashMap):
+        hm._drain()
+        table = hm.map
+    else:
+        table = hm
+
+    tmp_path = path + ".tmp"
+    try:
+        _write_snapshot(table, tmp_path, isinstance(hm, OrderedHashMap))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _write_snapshot(table: FixedSizeHashMap[K], path: str, ordered: bool) -> None:
+    offsets = array('Q', [0]) * (table.m + 1)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, table.m, table.size(), table.p, table.a, table.b, table.x))
+        offsets_pos = f.tell()
+        f.write(offsets.tobytes())  # Placeholder, rewritten below
+
+        pos = f.tell()
+        for i, bucket in enumerate(table.buckets):
+            offsets[i] = pos
+            for key, value, full_hash in bucket:
+                tag, key_bytes = _encode_key(key)
+                if ordered:
+                    value = value.value  # Not the _OrderNode and the chain behind it
+                value_bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                f.write(_ENTRY_PREFIX.pack(tag, len(key_bytes)))
+                f.write(key_bytes)
+                f.write(_LENGTH.pack(len(value_bytes)))
+                f.write(value_bytes)
+                pos += _ENTRY_PREFIX.size + len(key_bytes) + _LENGTH.size + len(value_bytes)
+        offsets[table.m] = pos
+
+        f.seek(offsets_pos)
+        f.write(offsets.tobytes())
+
+
+class MappedHashMap(Generic[K]):
+    """Read-only view of a snapshot that answers get straight from the file.
+
+    Opening only parses the header; the operating system pages bucket data
+    in as lookups touch it, so startup cost does not depend on the size of
+    the map.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.m, self._count, self.p, self.a, self.b, self.x = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a hash map snapshot")
+        self._offsets_pos = _HEADER.size
+
+    def _hash(self, key: K) -> int:
+        return _full_hash(key, self.p, self.a, self.b, self.x) % self.m
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:
+        mm = self._mm
+        start, end = _BOUNDS.unpack_from(mm, self._offsets_pos + 8 * self._hash(key))
+        tag, key_bytes = _encode_key(key)
+
+        # Compare encoded keys so nothing is decoded until the hit
+        pos = start
+        while pos < end:
+            entry_tag, key_len = _ENTRY_PREFIX.unpack_from(mm, pos)
+            key_start = pos + _ENTRY_PREFIX.size
+            value_pos = key_start + key_len
+            (value_len,) = _LENGTH.unpack_from(mm, value_pos)
+            value_start = value_pos + _LENGTH.size
+            if entry_tag == tag and mm[key_start:value_pos] == key_bytes:
+                return pickle.loads(mm[value_start:value_start + value_len])
+            pos = value_start + value_len
+        return default
+
+    def put(self, key: K, value: Any) -> None:
+        raise TypeError("MappedHashMap is read-only")
+
+    def remove(self, key: K) -> bool:
+        raise TypeError("MappedHashMap is read-only")
+
+    def size(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedHashMap[K]":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
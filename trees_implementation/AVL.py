@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 import time
 import matplotlib.pyplot as plt
 import random
-from typing import TypeVar, Generic, Optional, List, Any
+from typing import TypeVar, Generic, Iterable, Iterator, Optional, List, Tuple, Any
+from paging import paginate
 
 T = TypeVar('T')
 
@@ -20,12 +21,15 @@ class Queue(Generic[T]):
         return len(self.queue) == 0
 
 class TreeNode(Generic[T]):
+    __slots__ = ("value", "left", "right", "parent", "height", "size")
+
     def __init__(self, value: T) -> None:
         self.value: T = value
         self.left: Optional[TreeNode[T]] = None
         self.right: Optional[TreeNode[T]] = None
         self.parent: Optional[TreeNode[T]] = None
         self.height: int = 0
+        self.size: int = 1  # Nodes in the subtree rooted here
 
 class BinarySearchTreeInterface(Generic[T], ABC):
     @abstractmethod
@@ -68,32 +72,120 @@ class AVL(BinarySearchTreeInterface[T]):
     def __init__(self) -> None:
         self.root: Optional[TreeNode[T]] = None
     
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> "AVL[T]":
+        # Perfectly balanced tree in O(n): the middle value of every range
+        # becomes the root of that range's subtree
+        values = list(values)
+        if any(b < a for a, b in zip(values, values[1:])):  # type: ignore
+            raise ValueError("from_sorted needs the values in ascending order")
+        tree: AVL[T] = cls()
+        if not values:
+            return tree
+        nodes = [TreeNode(value) for value in values]
+        # (lo, hi, parent, is_left) ranges still to be linked, hi exclusive
+        pending: List[Tuple[int, int, Optional[TreeNode[T]], bool]] = [(0, len(nodes), None, False)]
+        while pending:
+            lo, hi, parent, is_left = pending.pop()
+            mid = (lo + hi) // 2
+            node = nodes[mid]
+            # Halves differ in size by at most one, so a range of s nodes
+            # is exactly s.bit_length() levels tall
+            node.height = (hi - lo).bit_length()
+            node.size = hi - lo
+            node.parent = parent
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if lo < mid:
+                pending.append((lo, mid, node, True))
+            if mid + 1 < hi:
+                pending.append((mid + 1, hi, node, False))
+        return tree
+    
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> "AVL[T]":
+        return cls.from_sorted(sorted(values))  # type: ignore
+    
     def size(self, start: Optional[TreeNode[T]]) -> int:
         if start is None:
             return 0
-        else:
-            return 1 + self.size(start.left) + self.size(start.right)
+        return start.size
     
     def inorder(self, start: Optional[TreeNode[T]]) -> None:
         if start is None:
             return
-        self.inorder(start.left)
-        print(start.value, end=" ") 
-        self.inorder(start.right)
+        node = self.leftdescendant(start)
+        while True:
+            print(node.value, end=" ")
+            if node.right is not None:
+                node = self.leftdescendant(node.right)
+                continue
+            # Climb out of right subtrees; the first left-child link leads to the next node
+            while node is not start and node is node.parent.right:
+                node = node.parent
+            if node is start:
+                return
+            node = node.parent
     
     def postorder(self, start: Optional[TreeNode[T]]) -> None:
         if start is None:
             return
-        self.postorder(start.left)
-        self.postorder(start.right)
-        print(start.value, end=" ")
+        node: Optional[TreeNode[T]] = self.deepest_first(start)
+        while node is not None:
+            print(node.value, end=" ")
+            node = self.postorder_next(node, start)
     
-    def preorder(self, start: Optional[TreeNode[T]]) -> None:    
-        if start is None:
-            return
-        print(start.value, end=" ")
-        self.preorder(start.left)
-        self.preorder(start.right)
+    def preorder(self, start: Optional[TreeNode[T]]) -> None:
+        node = start
+        while node is not None:
+            print(node.value, end=" ")
+            node = self.preorder_next(node, start)
+    
+    # Successors within the subtree rooted at start, found through parent
+    # pointers so that no traversal needs a stack or recursion
+    def inorder_next(self, node: TreeNode[T], start: TreeNode[T]) -> Optional[TreeNode[T]]:
+        if node.right is not None:
+            return self.leftdescendant(node.right)
+        while node is not start:
+            parent = node.parent
+            if node is parent.left:
+                return parent
+            node = parent
+        return None
+    
+    def preorder_next(self, node: TreeNode[T], start: Optional[TreeNode[T]]) -> Optional[TreeNode[T]]:
+        if node.left is not None:
+            return node.left
+        if node.right is not None:
+            return node.right
+        while node is not start:
+            parent = node.parent
+            if node is parent.left and parent.right is not None:
+                return parent.right
+            node = parent
+        return None
+    
+    def deepest_first(self, start: TreeNode[T]) -> TreeNode[T]:
+        """First node of start's subtree in postorder."""
+        while True:
+            if start.left is not None:
+                start = start.left
+            elif start.right is not None:
+                start = start.right
+            else:
+                return start
+    
+    def postorder_next(self, node: TreeNode[T], start: TreeNode[T]) -> Optional[TreeNode[T]]:
+        if node is start:
+            return None
+        parent = node.parent
+        if node is parent.left and parent.right is not None:
+            return self.deepest_first(parent.right)
+        return parent
     
     def leveltraversal(self) -> None:
         if self.root is None:
@@ -109,16 +201,16 @@ class AVL(BinarySearchTreeInterface[T]):
                 q.enqueue(node.right)
     
     def leftdescendant(self, start: TreeNode[T]) -> TreeNode[T]:
-        if start.left is None:
-            return start
-        return self.leftdescendant(start.left)
+        while start.left is not None:
+            start = start.left
+        return start
     
     def rightancestor(self, start: TreeNode[T]) -> Optional[TreeNode[T]]:
-        if start.parent is None:
-            return None
-        if start.value < start.parent.value:
-            return start.parent
-        return self.rightancestor(start.parent)
+        while start.parent is not None:
+            if start is start.parent.left:
+                return start.parent
+            start = start.parent
+        return None
     
     def next(self, start: TreeNode[T]) -> Optional[TreeNode[T]]:
         if start.right is not None:
@@ -134,6 +226,58 @@ class AVL(BinarySearchTreeInterface[T]):
             N = self.next(N)
         return L
     
+    def irange(self, lo: Optional[T] = None, hi: Optional[T] = None, reverse: bool = False) -> Iterator[T]:
+        """Values v with lo <= v <= hi in sorted order (descending if reverse),
+        produced lazily; None leaves that end of the range open.
+
+        The stack holds the ancestors still to be visited, at most the height
+        of the tree. The tree must not change while the iterator is in use.
+        """
+        stack: List[TreeNode[T]] = []
+        node = self.root
+        if not reverse:
+            while node is not None:
+                if lo is not None and node.value < lo:  # type: ignore
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            while stack:
+                node = stack.pop()
+                if hi is not None and node.value > hi:  # type: ignore
+                    return
+                yield node.value
+                node = node.right
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+        else:
+            while node is not None:
+                if hi is not None and node.value > hi:  # type: ignore
+                    node = node.left
+                else:
+                    stack.append(node)
+                    node = node.right
+            while stack:
+                node = stack.pop()
+                if lo is not None and node.value < lo:  # type: ignore
+                    return
+                yield node.value
+                node = node.left
+                while node is not None:
+                    stack.append(node)
+                    node = node.right
+    
+    def page(self, lo: Optional[T], hi: Optional[T], limit: int, cursor: Optional[Tuple[T, int]] = None,
+             reverse: bool = False) -> Tuple[List[T], Optional[Tuple[T, int]]]:
+        """Up to limit values of irange(lo, hi, reverse) following cursor.
+
+        Returns the page and the cursor of the next page, or None once the
+        range is exhausted. The cursor is (last value, times it has been
+        returned so far), so runs of duplicates can span pages.
+        """
+        return paginate(self.irange, lo, hi, limit, cursor, reverse)
+    
     def height(self, start: Optional[TreeNode[T]]) -> int:
         if start is None:
             return 0
@@ -146,6 +290,10 @@ class AVL(BinarySearchTreeInterface[T]):
         if node is not None:
             node.height = 1 + max(self.height(node.left), self.height(node.right))
     
+    def update_size(self, node: Optional[TreeNode[T]]) -> None:
+        if node is not None:
+            node.size = 1 + self.size(node.left) + self.size(node.right)
+    
     def balance_factor(self, node: Optional[TreeNode[T]]) -> int:
         if node is None:
             return 0
@@ -177,9 +325,11 @@ class AVL(BinarySearchTreeInterface[T]):
             else:
                 x.parent.right = x
         
-        # Update heights
+        # Update heights and sizes
         self.update_height(y)
         self.update_height(x)
+        self.update_size(y)
+        self.update_size(x)
         
         return x
     
@@ -209,9 +359,11 @@ class AVL(BinarySearchTreeInterface[T]):
             else:
                 y.parent.right = y
         
-        # Update heights
+        # Update heights and sizes
         self.update_height(x)
         self.update_height(y)
+        self.update_size(x)
+        self.update_size(y)
         
         return y
     
@@ -220,6 +372,7 @@ class AVL(BinarySearchTreeInterface[T]):
             return None
             
         self.update_height(node)
+        self.update_size(node)
         balance = self.balance_factor(node)
         
         # Left Heavy
@@ -239,18 +392,61 @@ class AVL(BinarySearchTreeInterface[T]):
         return node
     
     def find(self, key: T, start: Optional[TreeNode[T]]) -> Optional[TreeNode[T]]:
+        # Node holding key, or the last node on the search path
         if start is None:
             return None
-        if start.value == key:
-            return start
-        elif key < start.value:  # type: ignore
-            if start.left is not None:
-                return self.find(key, start.left)
-            return start
-        else:
-            if start.right is not None:
-                return self.find(key, start.right)
-            return start
+        while True:
+            if start.value == key:
+                return start
+            child = start.left if key < start.value else start.right  # type: ignore
+            if child is None:
+                return start
+            start = child
+    
+    # Order statistics from the subtree sizes, O(log n) each
+    def count_below(self, key: T, inclusive: bool = False) -> int:
+        """Number of values < key, or <= key if inclusive."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.value < key or (inclusive and node.value == key):  # type: ignore
+                count += self.size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+    
+    def rank(self, key: T) -> int:
+        """Number of values smaller than key, i.e. the index key would take in sorted order."""
+        return self.count_below(key)
+    
+    def select(self, k: int) -> T:
+        """The k-th smallest value, counting from 0."""
+        if not 0 <= k < self.size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left = self.size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.value
+            else:
+                k -= left + 1
+                node = node.right
+    
+    def count_range(self, x: T, y: T) -> int:
+        """Number of values v with x <= v <= y, the length of rangesearch(x, y)."""
+        if y < x:  # type: ignore
+            return 0
+        return self.count_below(y, inclusive=True) - self.count_below(x)
+    
+    def median(self) -> T:
+        """Lower median: the middle value, or the smaller of the two middle ones."""
+        n = self.size(self.root)
+        if n == 0:
+            raise IndexError("median of an empty tree")
+        return self.select((n - 1) // 2)
     
     def insert(self, value: T) -> None:
         new_node = TreeNode(value)
@@ -258,10 +454,14 @@ class AVL(BinarySearchTreeInterface[T]):
             self.root = new_node
             return
             
-        parent = self.find(value, self.root)
-        if parent is None:
-            self.root = new_node
-            return
+        # Walk down to an empty slot; find would stop at an equal value and
+        # the new node would then replace that node's right subtree
+        parent = self.root
+        while True:
+            child = parent.left if value < parent.value else parent.right  # type: ignore
+            if child is None:
+                break
+            parent = child
             
         new_node.parent = parent
         
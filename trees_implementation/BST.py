@@ -2,7 +2,8 @@ from abc import ABC, abstractmethod
 import time
 import matplotlib.pyplot as plt
 import random
-from typing import TypeVar, Generic, Optional, List, Any
+from typing import TypeVar, Generic, Iterator, Optional, List, Tuple, Any
+from paging import paginate
 
 T = TypeVar('T')  # Define type variable for comparable types
 
@@ -20,6 +21,8 @@ class Queue(Generic[T]):
         return len(self.queue) == 0
 
 class TreeNode(Generic[T]):
+    __slots__ = ("value", "left", "right", "parent", "height")
+
     def __init__(self, value: T) -> None:
         self.value: T = value
         self.left: Optional[TreeNode[T]] = None
@@ -69,45 +72,133 @@ class BST(BinarySearchTreeInterface[T]):
         self.root: Optional[TreeNode[T]] = None
     
     def height(self, start: Optional[TreeNode[T]]) -> int:
+        # Walk the subtree through parent pointers, tracking the depth
         if start is None:
             return 0
-        elif start.left is None and start.right is None:
-            return 1
-        else:
-            return 1 + max(self.height(start.left), self.height(start.right))
-        
+        node = start
+        depth = best = 1
+        while True:
+            if node.left is not None:
+                node = node.left
+            elif node.right is not None:
+                node = node.right
+            else:
+                # Climb to the nearest ancestor whose right subtree is unvisited
+                while node is not start:
+                    parent = node.parent
+                    depth -= 1
+                    if node is parent.left and parent.right is not None:
+                        node = parent.right
+                        break
+                    node = parent
+                else:
+                    return best
+            depth += 1
+            if depth > best:
+                best = depth
+    
     def height2(self, start: Optional[TreeNode[T]]) -> int:
-        if start is None:
-            return 0
-        else:
-            return 1 + max(self.height(start.left), self.height(start.right))
+        # Count the levels of a level-order traversal
+        levels = 0
+        level = [start] if start is not None else []
+        while level:
+            levels += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return levels
     
     def size(self, start: Optional[TreeNode[T]]) -> int:
+        # Same walk as preorder_next, inlined
         if start is None:
             return 0
-        else:
-            return 1 + self.size(start.left) + self.size(start.right)
+        node = start
+        count = 1
+        while True:
+            if node.left is not None:
+                node = node.left
+            elif node.right is not None:
+                node = node.right
+            else:
+                while node is not start:
+                    parent = node.parent
+                    if node is parent.left and parent.right is not None:
+                        node = parent.right
+                        break
+                    node = parent
+                else:
+                    return count
+            count += 1
     
     def inorder(self, start: Optional[TreeNode[T]]) -> None:
         if start is None:
             return
-        self.inorder(start.left)
-        print(start.value, end=" ") 
-        self.inorder(start.right)
+        node = self.leftdescendant(start)
+        while True:
+            print(node.value, end=" ")
+            if node.right is not None:
+                node = self.leftdescendant(node.right)
+                continue
+            # Climb out of right subtrees; the first left-child link leads to the next node
+            while node is not start and node is node.parent.right:
+                node = node.parent
+            if node is start:
+                return
+            node = node.parent
     
     def postorder(self, start: Optional[TreeNode[T]]) -> None:
         if start is None:
             return
-        self.postorder(start.left)
-        self.postorder(start.right)
-        print(start.value, end=" ")
+        node: Optional[TreeNode[T]] = self.deepest_first(start)
+        while node is not None:
+            print(node.value, end=" ")
+            node = self.postorder_next(node, start)
     
-    def preorder(self, start: Optional[TreeNode[T]]) -> None:    
-        if start is None:
-            return
-        print(start.value, end=" ")
-        self.preorder(start.left)
-        self.preorder(start.right)
+    def preorder(self, start: Optional[TreeNode[T]]) -> None:
+        node = start
+        while node is not None:
+            print(node.value, end=" ")
+            node = self.preorder_next(node, start)
+    
+    # Successors within the subtree rooted at start, found through parent
+    # pointers so that no traversal needs a stack or recursion
+    def inorder_next(self, node: TreeNode[T], start: TreeNode[T]) -> Optional[TreeNode[T]]:
+        if node.right is not None:
+            return self.leftdescendant(node.right)
+        while node is not start:
+            parent = node.parent
+            if node is parent.left:
+                return parent
+            node = parent
+        return None
+    
+    def preorder_next(self, node: TreeNode[T], start: Optional[TreeNode[T]]) -> Optional[TreeNode[T]]:
+        if node.left is not None:
+            return node.left
+        if node.right is not None:
+            return node.right
+        while node is not start:
+            parent = node.parent
+            if node is parent.left and parent.right is not None:
+                return parent.right
+            node = parent
+        return None
+    
+    def deepest_first(self, start: TreeNode[T]) -> TreeNode[T]:
+        """First node of start's subtree in postorder."""
+        while True:
+            if start.left is not None:
+                start = start.left
+            elif start.right is not None:
+                start = start.right
+            else:
+                return start
+    
+    def postorder_next(self, node: TreeNode[T], start: TreeNode[T]) -> Optional[TreeNode[T]]:
+        if node is start:
+            return None
+        parent = node.parent
+        if node is parent.left and parent.right is not None:
+            return self.deepest_first(parent.right)
+        return parent
     
     def leveltraversal(self) -> None:
         if self.root is None:
@@ -123,28 +214,27 @@ class BST(BinarySearchTreeInterface[T]):
                 q.enqueue(node.right)
     
     def find(self, key: T, start: TreeNode[T]) -> TreeNode[T]:
-        if start.value == key:
-            return start
-        elif key < start.value:  
-            if start.left is not None:
-                return self.find(key, start.left)
-            return start
-        else:
-            if start.right is not None:
-                return self.find(key, start.right)
-            return start
+        # Node holding key, or the last node on the search path (the parent
+        # a new key would hang from)
+        while True:
+            if start.value == key:
+                return start
+            child = start.left if key < start.value else start.right
+            if child is None:
+                return start
+            start = child
     
     def leftdescendant(self, start: TreeNode[T]) -> TreeNode[T]:
-        if start.left is None:
-            return start
-        return self.leftdescendant(start.left)
+        while start.left is not None:
+            start = start.left
+        return start
     
     def rightancestor(self, start: TreeNode[T]) -> Optional[TreeNode[T]]:
-        if start.parent is None:
-            return None
-        if start.value < start.parent.value:  
-            return start.parent
-        return self.rightancestor(start.parent)
+        while start.parent is not None:
+            if start is start.parent.left:
+                return start.parent
+            start = start.parent
+        return None
     
     def next(self, start: TreeNode[T]) -> Optional[TreeNode[T]]:
         if start.right is not None:
@@ -160,12 +250,73 @@ class BST(BinarySearchTreeInterface[T]):
             N = self.next(N)
         return L
     
+    def irange(self, lo: Optional[T] = None, hi: Optional[T] = None, reverse: bool = False) -> Iterator[T]:
+        """Values v with lo <= v <= hi in sorted order (descending if reverse),
+        produced lazily; None leaves that end of the range open.
+
+        The stack holds the ancestors still to be visited, at most the height
+        of the tree. The tree must not change while the iterator is in use.
+        """
+        stack: List[TreeNode[T]] = []
+        node = self.root
+        if not reverse:
+            while node is not None:
+                if lo is not None and node.value < lo:  # type: ignore
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            while stack:
+                node = stack.pop()
+                if hi is not None and node.value > hi:  # type: ignore
+                    return
+                yield node.value
+                node = node.right
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+        else:
+            while node is not None:
+                if hi is not None and node.value > hi:  # type: ignore
+                    node = node.left
+                else:
+                    stack.append(node)
+                    node = node.right
+            while stack:
+                node = stack.pop()
+                if lo is not None and node.value < lo:  # type: ignore
+                    return
+                yield node.value
+                node = node.left
+                while node is not None:
+                    stack.append(node)
+                    node = node.right
+    
+    def page(self, lo: Optional[T], hi: Optional[T], limit: int, cursor: Optional[Tuple[T, int]] = None,
+             reverse: bool = False) -> Tuple[List[T], Optional[Tuple[T, int]]]:
+        """Up to limit values of irange(lo, hi, reverse) following cursor.
+
+        Returns the page and the cursor of the next page, or None once the
+        range is exhausted. The cursor is (last value, times it has been
+        returned so far), so runs of duplicates can span pages.
+        """
+        return paginate(self.irange, lo, hi, limit, cursor, reverse)
+    
     def insert(self, value: T) -> None:
         new_node = TreeNode(value)
         if self.root is None:
             self.root = new_node
         else:
-            parent = self.find(value, self.root)
+            # Walk down to an empty slot instead of going through find: find
+            # stops at an equal value, and the new node would then replace
+            # that node's right subtree. Equal values go right, so a
+            # duplicate lands after the copies already in the tree.
+            parent = self.root
+            while True:
+                child = parent.left if value < parent.value else parent.right
+                if child is None:
+                    break
+                parent = child
             new_node.parent = parent
             if value < parent.value:  
                 parent.left = new_node
@@ -182,43 +333,40 @@ class BST(BinarySearchTreeInterface[T]):
             print("Node not found")
             return
             
-        def delete_node(node: TreeNode[T]) -> None:
-            # Case 1: Leaf
-            if node.left is None and node.right is None:
-                if node == self.root:
-                    self.root = None
-                else:
-                    parent = node.parent
-                    if parent is not None:
-                        if parent.left == node:
-                            parent.left = None
-                        else:
-                            parent.right = None
-                        
-            # Case 2: 1 child
-            elif node.left is None or node.right is None:
-                child = node.left if node.left else node.right
-                if node == self.root:
-                    self.root = child
-                    if child is not None:
-                        child.parent = None
-                else:
-                    parent = node.parent
-                    if parent is not None and child is not None:
-                        if parent.left == node:
-                            parent.left = child
-                        else:
-                            parent.right = child
-                        child.parent = parent
+        # Case 3: 2 children. Move the successor's value up and delete the
+        # successor instead; it has no left child, so cases 1 and 2 cover it
+        if node.left is not None and node.right is not None:
+            next_node = self.leftdescendant(node.right)
+            node.value = next_node.value
+            node = next_node
+            
+        # Case 1: Leaf
+        if node.left is None and node.right is None:
+            if node == self.root:
+                self.root = None
+            else:
+                parent = node.parent
+                if parent is not None:
+                    if parent.left is node:
+                        parent.left = None
+                    else:
+                        parent.right = None
                     
-            # Case 3: 2 children
+        # Case 2: 1 child
+        else:
+            child = node.left if node.left else node.right
+            if node == self.root:
+                self.root = child
+                if child is not None:
+                    child.parent = None
             else:
-                next_node = self.next(node)
-                if next_node is not None:
-                    node.value = next_node.value
-                    delete_node(next_node)
-        
-        delete_node(node)
+                parent = node.parent
+                if parent is not None and child is not None:
+                    if parent.left is node:
+                        parent.left = child
+                    else:
+                        parent.right = child
+                    child.parent = parent
         
 if __name__ == "__main__":
     h1 = []
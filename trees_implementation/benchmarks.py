@@ -0,0 +1,379 @@
+import contextlib
+import gc
+import itertools
+import os
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from AVL import AVL
+from BST import BST, TreeNode
+from bplus_tree import BPlusTree
+from compact_avl import CompactAVL
+
+
+# Recursive versions of the walks, as BST.py and AVL.py used to implement them
+def recursive_height(start: Optional[TreeNode]) -> int:
+    if start is None:
+        return 0
+    return 1 + max(recursive_height(start.left), recursive_height(start.right))
+
+
+def recursive_size(start: Optional[TreeNode]) -> int:
+    if start is None:
+        return 0
+    return 1 + recursive_size(start.left) + recursive_size(start.right)
+
+
+def recursive_find(key: Any, start: TreeNode) -> TreeNode:
+    if start.value == key:
+        return start
+    child = start.left if key < start.value else start.right
+    if child is None:
+        return start
+    return recursive_find(key, child)
+
+
+def recursive_inorder(start: Optional[TreeNode]) -> None:
+    if start is None:
+        return
+    recursive_inorder(start.left)
+    print(start.value, end=" ")
+    recursive_inorder(start.right)
+
+
+def right_chain(n: int) -> BST:
+    """The BST that inserting 0..n-1 in order produces: a chain of right children.
+
+    Linked directly, since building it through insert costs O(n^2).
+    """
+    tree: BST = BST()
+    prev: Optional[TreeNode] = None
+    for value in range(n):
+        node = TreeNode(value)
+        if prev is None:
+            tree.root = node
+        else:
+            prev.right = node
+            node.parent = prev
+        prev = node
+    return tree
+
+
+def _timed(op: Callable[[], Any]) -> Tuple[Optional[float], Any]:
+    """(seconds, result) of op() with stdout discarded, or (None, error name)."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            start = time.perf_counter()
+            result = op()
+            return time.perf_counter() - start, result
+    except RecursionError:
+        return None, "RecursionError"
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _find_all(find: Callable[[Any, Any], Any], keys: List[Any], root: Any,
+              value_of: Callable[[Any], Any] = lambda node: node.value) -> int:
+    found = 0
+    for key in keys:
+        if value_of(find(key, root)) == key:
+            found += 1
+    return found
+
+
+def _compare_walks(tree: Any, label: str, n: int, keys: List[Any]) -> List[Dict[str, Any]]:
+    """Time each walk both ways; find looks up every key in keys."""
+    root = tree.root
+    walks = [
+        ("height", lambda: tree.height(root), lambda: recursive_height(root)),
+        ("size", lambda: tree.size(root), lambda: recursive_size(root)),
+        ("find", lambda: _find_all(tree.find, keys, root), lambda: _find_all(recursive_find, keys, root)),
+        ("inorder", lambda: tree.inorder(root), lambda: recursive_inorder(root)),
+    ]
+    if isinstance(tree, AVL):
+        del walks[:2]  # AVL reads the height and size stored in the root
+    results = []
+    for op, iterative, recursive in walks:
+        iterative_s, result = _timed(iterative)
+        recursive_s, recursive_result = _timed(recursive)
+        results.append({
+            "tree": label,
+            "n": n,
+            "op": op,
+            "result": result,
+            "iterative_s": iterative_s,
+            "recursive_s": recursive_s,
+            "recursive_error": recursive_result if recursive_s is None else None,
+        })
+    return results
+
+
+def bench_degenerate_walks(sizes: Tuple[int, ...] = (500, 10_000, 100_000, 1_000_000)
+                           ) -> List[Dict[str, Any]]:
+    """Walks over a sorted-insert BST chain, iterative against recursive."""
+    results = []
+    for n in sizes:
+        # Looking up the deepest key walks the whole chain
+        results += _compare_walks(right_chain(n), "bst chain", n, [n - 1])
+    return results
+
+
+def bench_balanced_walks(n: int = 200_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """The same walks on trees shallow enough for the recursive versions."""
+    rng = random.Random(seed)
+    values = list(range(n))
+    rng.shuffle(values)
+    results = []
+    for label, tree in (("bst random", BST()), ("avl random", AVL())):
+        for value in values:
+            tree.insert(value)
+        results += _compare_walks(tree, label, n, values)
+    return results
+
+
+def bench_sorted_insert(n: int = 5_000) -> List[Dict[str, Any]]:
+    """Sorted inserts, which turn a BST into a chain and used to overflow the stack."""
+    results = []
+    for label, tree in (("bst", BST()), ("avl", AVL())):
+        start = time.perf_counter()
+        for value in range(n):
+            tree.insert(value)
+        insert_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for value in range(0, n, 2):
+            tree.delete(value)
+        delete_s = time.perf_counter() - start
+        results.append({
+            "tree": label,
+            "n": n,
+            "insert_s": insert_s,
+            "delete_s": delete_s,
+            "height": tree.height(tree.root),
+            "size": tree.size(tree.root),
+        })
+    return results
+
+
+def bench_bulk_build(n: int = 1_000_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """AVL construction: n inserts against from_sorted / from_iterable."""
+    rng = random.Random(seed)
+    shuffled = list(range(n))
+    rng.shuffle(shuffled)
+    ordered = sorted(shuffled)
+    builds: List[Tuple[str, str, Callable[[], AVL]]] = [
+        ("insert", "sorted", lambda: _insert_all(ordered)),
+        ("from_sorted", "sorted", lambda: AVL.from_sorted(ordered)),
+        ("insert", "shuffled", lambda: _insert_all(shuffled)),
+        ("from_iterable", "shuffled", lambda: AVL.from_iterable(shuffled)),
+    ]
+    results = []
+    for method, order, build in builds:
+        seconds, tree = _timed(build)
+        results.append({"method": method, "input": order, "n": n, "seconds": seconds,
+                        "height": tree.height(tree.root)})
+        del tree
+        gc.collect()
+    return results
+
+
+def _insert_all(values: List[Any]) -> AVL:
+    tree: AVL = AVL()
+    for value in values:
+        tree.insert(value)
+    return tree
+
+
+def bench_order_statistics(n: int = 1_000_000, queries: int = 1_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """count_range and select against counting or indexing a rangesearch result."""
+    rng = random.Random(seed)
+    tree = AVL.from_sorted(range(n))
+    results = []
+    for width in (100, 10_000, n // 10):
+        lows = [rng.randrange(n - width) for _ in range(queries)]
+        start = time.perf_counter()
+        counted = [tree.count_range(lo, lo + width - 1) for lo in lows]
+        count_s = time.perf_counter() - start
+        # rangesearch is linear in the width: time a sample and scale it to all queries
+        sample = lows[:max(1, queries * 100 // width)]
+        start = time.perf_counter()
+        listed = [len(tree.rangesearch(lo, lo + width - 1, tree.root)) for lo in sample]
+        listed_s = (time.perf_counter() - start) * queries / len(sample)
+        assert counted[:len(sample)] == listed
+        results.append({"width": width, "queries": queries, "count_range_s": count_s, "rangesearch_s": listed_s})
+    ks = [rng.randrange(n) for _ in range(queries)]
+    start = time.perf_counter()
+    for k in ks:
+        tree.select(k)
+    results.append({"width": None, "queries": queries, "select_s": time.perf_counter() - start})
+    return results
+
+
+def _peak_bytes(op: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        op()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _drain(values: Any) -> int:
+    count = 0
+    for _ in values:
+        count += 1
+    return count
+
+
+def _page_through(tree: AVL, limit: int) -> int:
+    count = 0
+    items, cursor = tree.page(None, None, limit)
+    count += len(items)
+    while cursor is not None:
+        items, cursor = tree.page(None, None, limit, cursor)
+        count += len(items)
+    return count
+
+
+def bench_range_scans(n: int = 1_000_000, first: int = 100, limit: int = 10_000) -> List[Dict[str, Any]]:
+    """rangesearch against the lazy irange and page on an AVL of n keys."""
+    tree = AVL.from_sorted(range(n))
+    scans: List[Tuple[str, Callable[[], Any]]] = [
+        ("rangesearch all", lambda: len(tree.rangesearch(0, n, tree.root))),
+        ("irange all", lambda: _drain(tree.irange(0, n))),
+        ("irange all reverse", lambda: _drain(tree.irange(0, n, reverse=True))),
+        (f"page all by {limit}", lambda: _page_through(tree, limit)),
+        (f"rangesearch first {first}", lambda: tree.rangesearch(n // 2, n, tree.root)[:first]),
+        (f"irange first {first}", lambda: list(itertools.islice(tree.irange(n // 2, n), first))),
+    ]
+    results = []
+    for name, scan in scans:
+        seconds, result = _timed(scan)
+        results.append({"scan": name, "n": n, "seconds": seconds,
+                        "result": result if isinstance(result, int) else len(result),
+                        "peak_mb": _peak_bytes(scan) / 2 ** 20})
+    return results
+
+
+def bench_compact_tree(n: int = 1_000_000, ops: int = 200_000, seed: int = 42) -> List[Dict[str, Any]]:
+    """Memory per key and find/insert throughput of AVL against CompactAVL.
+
+    Both trees hold the even numbers below 2n; the inserts add odd ones.
+    Memory is what building the tree allocates, the value objects aside.
+    """
+    rng = random.Random(seed)
+    evens = list(range(0, 2 * n, 2))
+    probes = [rng.choice(evens) for _ in range(ops)]
+    odds = [2 * k + 1 for k in rng.sample(range(n), ops)]
+    results = []
+    for name, cls in (("AVL", AVL), ("CompactAVL", CompactAVL)):
+        gc.collect()
+        tracemalloc.start()
+        tree: Any = cls.from_sorted(evens)
+        built = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        value_of = tree.value if cls is CompactAVL else (lambda node: node.value)
+        find_s, _ = _timed(lambda: _find_all(tree.find, probes, tree.root, value_of))
+        insert_s, _ = _timed(lambda: [tree.insert(key) for key in odds])
+        results.append({"tree": name, "n": n, "bytes_per_key": built / n,
+                        "find_ops": ops / find_s, "insert_ops": ops / insert_s})
+        del tree
+    return results
+
+
+def bench_bplus_tree(n: int = 1_000_000, ops: int = 200_000, range_queries: int = 1_000,
+                     orders: Tuple[int, ...] = (16, 64, 256), seed: int = 42) -> List[Dict[str, Any]]:
+    """AVL against B+trees of several orders: build, memory, point and range queries.
+
+    The trees hold the even numbers below 2n. Point lookups hit present keys,
+    range queries drain irange over `width` consecutive keys, and the
+    inserts add odd keys.
+    """
+    rng = random.Random(seed)
+    evens = list(range(0, 2 * n, 2))
+    probes = [rng.choice(evens) for _ in range(ops)]
+    odds = [2 * k + 1 for k in rng.sample(range(n), ops)]
+    builds: List[Tuple[str, Callable[[], Any]]] = [("AVL", lambda: AVL.from_sorted(evens))]
+    builds += [(f"B+tree {order}", lambda order=order: BPlusTree.from_sorted(evens, order)) for order in orders]
+    results = []
+    for name, build in builds:
+        gc.collect()
+        tracemalloc.start()
+        tree: Any = build()
+        built = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        gc.collect()
+        build_s, tree = _timed(build)
+        if isinstance(tree, AVL):
+            root = tree.root
+            contains = lambda key: tree.find(key, root).value == key
+        else:
+            contains = tree.contains
+        lookup_s, found = _timed(lambda: sum(1 for key in probes if contains(key)))
+        row = {"tree": name, "n": n, "build_s": build_s, "bytes_per_key": built / n,
+               "lookup_ops": ops / lookup_s, "height": tree.height(tree.root)}
+        assert found == ops
+        for width in (100, 10_000):
+            lows = [2 * rng.randrange(n - width) for _ in range(range_queries)]
+            range_s, _ = _timed(lambda: [_drain(tree.irange(lo, lo + 2 * (width - 1))) for lo in lows])
+            row[f"range_{width}_ops"] = range_queries / range_s
+        insert_s, _ = _timed(lambda: [tree.insert(key) for key in odds])
+        row["insert_ops"] = ops / insert_s
+        results.append(row)
+        del tree
+    return results
+
+
+if __name__ == "__main__":
+    def seconds(value: Optional[float]) -> str:
+        return f"{value:.4f}" if value is not None else "crash"
+
+    print(f"{'tree':<12}{'n':>9}{'op':>9}{'iterative s':>13}{'recursive s':>13}{'speedup':>9}")
+    for row in bench_degenerate_walks() + bench_balanced_walks():
+        speedup = (f"{row['recursive_s'] / row['iterative_s']:.2f}"
+                   if row["recursive_s"] is not None and row["iterative_s"] else "-")
+        print(f"{row['tree']:<12}{row['n']:>9}{row['op']:>9}{seconds(row['iterative_s']):>13}"
+              f"{seconds(row['recursive_s']):>13}{speedup:>9}")
+
+    print()
+    print(f"{'tree':<6}{'n':>7}{'insert s':>10}{'delete s':>10}{'height':>8}{'size':>7}")
+    for row in bench_sorted_insert():
+        print(f"{row['tree']:<6}{row['n']:>7}{row['insert_s']:>10.3f}{row['delete_s']:>10.3f}"
+              f"{row['height']:>8}{row['size']:>7}")
+
+    print()
+    print(f"{'method':<15}{'input':<10}{'n':>9}{'seconds':>9}{'height':>8}")
+    for row in bench_bulk_build():
+        print(f"{row['method']:<15}{row['input']:<10}{row['n']:>9}{row['seconds']:>9.3f}{row['height']:>8}")
+
+    print()
+    print(f"{'range width':>12}{'count_range s':>15}{'len(rangesearch) s':>20}")
+    for row in bench_order_statistics():
+        if row["width"] is None:
+            print(f"{row['queries']} selects: {row['select_s']:.4f}s")
+        else:
+            print(f"{row['width']:>12}{row['count_range_s']:>15.4f}{row['rangesearch_s']:>20.4f}")
+
+    print()
+    print(f"{'scan':<22}{'values':>9}{'seconds':>9}{'peak MB':>9}")
+    for row in bench_range_scans():
+        print(f"{row['scan']:<22}{row['result']:>9}{row['seconds']:>9.3f}{row['peak_mb']:>9.2f}")
+
+    print()
+    print(f"{'tree':<12}{'n':>9}{'bytes/key':>11}{'find/s':>10}{'insert/s':>10}")
+    for row in bench_compact_tree():
+        print(f"{row['tree']:<12}{row['n']:>9}{row['bytes_per_key']:>11.1f}{row['find_ops']:>10.0f}"
+              f"{row['insert_ops']:>10.0f}")
+
+    print()
+    print(f"{'tree':<13}{'height':>7}{'build s':>9}{'bytes/key':>11}{'find/s':>10}{'range100/s':>12}"
+          f"{'range10k/s':>12}{'insert/s':>10}")
+    for row in bench_bplus_tree():
+        print(f"{row['tree']:<13}{row['height']:>7}{row['build_s']:>9.3f}{row['bytes_per_key']:>11.1f}"
+              f"{row['lookup_ops']:>10.0f}{row['range_100_ops']:>12.0f}{row['range_10000_ops']:>12.1f}"
+              f"{row['insert_ops']:>10.0f}")
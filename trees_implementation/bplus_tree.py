@@ -0,0 +1,355 @@
+from bisect import bisect_left, bisect_right, insort_right
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, Union
+
+from AVL import BinarySearchTreeInterface, T
+
+
+class Leaf(Generic[T]):
+    __slots__ = ("keys", "prev", "next")
+
+    def __init__(self, keys: List[T]) -> None:
+        self.keys = keys
+        self.prev: Optional[Leaf[T]] = None
+        self.next: Optional[Leaf[T]] = None
+
+
+class Internal(Generic[T]):
+    """keys[i] separates children[i] from children[i + 1]: every key below
+    children[i] is <= keys[i] <= every key below children[i + 1]."""
+
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys: List[T], children: List[Any]) -> None:
+        self.keys = keys
+        self.children = children
+
+
+Node = Union[Leaf, Internal]
+
+
+def _chunks(items: List[Any], max_len: int) -> List[List[Any]]:
+    """items split into the fewest runs of at most max_len, sizes differing by at most one."""
+    count = -(-len(items) // max_len)
+    step, extra = divmod(len(items), count)
+    runs = []
+    start = 0
+    for i in range(count):
+        end = start + step + (1 if i < extra else 0)
+        runs.append(items[start:end])
+        start = end
+    return runs
+
+
+class BPlusTree(BinarySearchTreeInterface[T]):
+    """B+tree: internal nodes hold separators, leaves hold the keys and are
+    linked in both directions for sequential scans.
+
+    Every node keeps a sorted Python list searched with bisect, so a lookup
+    touches one node per level, about log(n) / log(order) of them. A leaf
+    holds at most order keys and an internal node at most order children;
+    nodes other than the root stay at least half full. Like BST and AVL the
+    tree is a multiset: inserting a key that is present adds another copy.
+    """
+
+    def __init__(self, order: int = 64) -> None:
+        if order < 4:
+            raise ValueError("order must be at least 4")
+        self.order = order
+        self.min_fill = order // 2
+        self.root: Node = Leaf([])
+        self.count = 0
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[T], order: int = 64) -> "BPlusTree[T]":
+        # Bulk load bottom-up: full leaves, then each level of separators
+        values = list(values)
+        if any(b < a for a, b in zip(values, values[1:])):  # type: ignore
+            raise ValueError("from_sorted needs the values in ascending order")
+        tree: BPlusTree[T] = cls(order)
+        if not values:
+            return tree
+        leaves = [Leaf(keys) for keys in _chunks(values, order)]
+        for left, right in zip(leaves, leaves[1:]):
+            left.next = right
+            right.prev = left
+        # Each level as (node, smallest key below it) pairs
+        level: List[Tuple[Node, T]] = [(leaf, leaf.keys[0]) for leaf in leaves]
+        while len(level) > 1:
+            level = [(Internal([low for node, low in group[1:]], [node for node, low in group]), group[0][1])
+                     for group in _chunks(level, order)]
+        tree.root = level[0][0]
+        tree.count = len(values)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T], order: int = 64) -> "BPlusTree[T]":
+        return cls.from_sorted(sorted(values), order)  # type: ignore
+
+    def _leftmost_leaf(self, start: Node) -> Leaf[T]:
+        while isinstance(start, Internal):
+            start = start.children[0]
+        return start
+
+    def _rightmost_leaf(self, start: Node) -> Leaf[T]:
+        while isinstance(start, Internal):
+            start = start.children[-1]
+        return start
+
+    def height(self, start: Optional[Node]) -> int:
+        levels = 0
+        while start is not None:
+            levels += 1
+            start = start.children[0] if isinstance(start, Internal) else None
+        return levels
+
+    def size(self, start: Optional[Node]) -> int:
+        if start is None:
+            return 0
+        if start is self.root:
+            return self.count
+        # Walk the leaf chain under start
+        leaf: Optional[Leaf[T]] = self._leftmost_leaf(start)
+        last = self._rightmost_leaf(start)
+        count = 0
+        while leaf is not None:
+            count += len(leaf.keys)
+            if leaf is last:
+                break
+            leaf = leaf.next
+        return count
+
+    def inorder(self, start: Optional[Node]) -> None:
+        if start is None:
+            return
+        leaf: Optional[Leaf[T]] = self._leftmost_leaf(start)
+        last = self._rightmost_leaf(start)
+        while leaf is not None:
+            for key in leaf.keys:
+                print(key, end=" ")
+            if leaf is last:
+                break
+            leaf = leaf.next
+
+    # Pre- and postorder print each node's key list, separators included
+    def preorder(self, start: Optional[Node]) -> None:
+        stack = [start] if start is not None else []
+        while stack:
+            node = stack.pop()
+            print(node.keys, end=" ")
+            if isinstance(node, Internal):
+                stack.extend(reversed(node.children))
+
+    def postorder(self, start: Optional[Node]) -> None:
+        # Reverse of a preorder that visits children right to left
+        order: List[Node] = []
+        stack = [start] if start is not None else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            if isinstance(node, Internal):
+                stack.extend(node.children)
+        for node in reversed(order):
+            print(node.keys, end=" ")
+
+    def leveltraversal(self) -> None:
+        level: List[Node] = [self.root]
+        while level:
+            for node in level:
+                print(node.keys)
+            level = [child for node in level if isinstance(node, Internal) for child in node.children]
+
+    def find(self, key: T, start: Optional[Node] = None) -> Leaf[T]:
+        """Leaf holding the first copy of key, or the leaf where it would go."""
+        node = self.root if start is None else start
+        while isinstance(node, Internal):
+            node = node.children[bisect_left(node.keys, key)]
+        # A run of copies can start past the end of the leaf the separators lead to
+        while node.next is not None and (not node.keys or node.keys[-1] < key):  # type: ignore
+            if node.next.keys[0] > key:  # type: ignore
+                break
+            node = node.next
+        return node
+
+    def contains(self, key: T) -> bool:
+        node = self.root
+        while isinstance(node, Internal):
+            node = node.children[bisect_left(node.keys, key)]
+        keys = node.keys
+        i = bisect_left(keys, key)
+        if i < len(keys):
+            return keys[i] == key
+        # Past the end of the leaf: the first copy can only open the next one
+        return node.next is not None and node.next.keys[0] == key
+
+    def __contains__(self, key: Any) -> bool:
+        return self.contains(key)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def irange(self, lo: Optional[T] = None, hi: Optional[T] = None, reverse: bool = False) -> Iterator[T]:
+        """Values v with lo <= v <= hi in sorted order (descending if reverse),
+        produced lazily by following the leaf links; None leaves that end of
+        the range open. The tree must not change while the iterator is in use.
+        """
+        leaf: Optional[Leaf[T]]
+        if not reverse:
+            if lo is None:
+                leaf, i = self._leftmost_leaf(self.root), 0
+            else:
+                leaf = self.find(lo)
+                i = bisect_left(leaf.keys, lo)
+            while leaf is not None:
+                keys = leaf.keys
+                if hi is not None and keys and keys[-1] > hi:  # type: ignore
+                    yield from keys[i:bisect_right(keys, hi)]
+                    return
+                yield from keys[i:]
+                leaf, i = leaf.next, 0
+        else:
+            node = self.root
+            while isinstance(node, Internal):
+                node = node.children[-1 if hi is None else bisect_right(node.keys, hi)]
+            leaf = node
+            j = len(leaf.keys) if hi is None else bisect_right(leaf.keys, hi)
+            while leaf is not None:
+                keys = leaf.keys
+                if lo is not None and keys and keys[0] < lo:  # type: ignore
+                    yield from reversed(keys[bisect_left(keys, lo):j])
+                    return
+                yield from reversed(keys[:j])
+                leaf = leaf.prev
+                j = len(leaf.keys) if leaf is not None else 0
+
+    def rangesearch(self, x: T, y: T, start: Optional[Node] = None) -> List[T]:
+        return list(self.irange(x, y))
+
+    def insert(self, value: T) -> None:
+        # Descend to the rightmost place for value, remembering the path
+        path: List[Tuple[Internal[T], int]] = []
+        node = self.root
+        while isinstance(node, Internal):
+            i = bisect_right(node.keys, value)
+            path.append((node, i))
+            node = node.children[i]
+        insort_right(node.keys, value)
+        self.count += 1
+        if len(node.keys) <= self.order:
+            return
+
+        # Split full nodes bottom-up; each split hands a separator to the parent
+        keys = node.keys
+        half = len(keys) // 2
+        right: Node = Leaf(keys[half:])
+        del keys[half:]
+        right.next = node.next
+        right.prev = node
+        if node.next is not None:
+            node.next.prev = right
+        node.next = right
+        separator = right.keys[0]
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, right)
+            if len(parent.children) <= self.order:
+                return
+            half = len(parent.keys) // 2
+            separator = parent.keys[half]
+            right = Internal(parent.keys[half + 1:], parent.children[half + 1:])
+            del parent.keys[half:]
+            del parent.children[half + 1:]
+            node = parent
+        self.root = Internal([separator], [node, right])
+
+    def delete(self, value: T) -> None:
+        # Descend to the leftmost candidate leaf, remembering the path
+        path: List[Tuple[Internal[T], int]] = []
+        node = self.root
+        while isinstance(node, Internal):
+            i = bisect_left(node.keys, value)
+            path.append((node, i))
+            node = node.children[i]
+        i = bisect_left(node.keys, value)
+        while i == len(node.keys) and node.next is not None and node.next.keys[0] <= value:  # type: ignore
+            # The copies start in a later leaf: step the path one leaf to the right
+            node = self._advance(path)
+            i = bisect_left(node.keys, value)
+        if i == len(node.keys) or node.keys[i] != value:
+            return
+        del node.keys[i]
+        self.count -= 1
+
+        # Refill underfull nodes bottom-up from a sibling, or merge with it
+        while path and self._underfull(node):
+            parent, i = path.pop()
+            if i > 0 and self._can_lend(parent.children[i - 1]):
+                self._borrow_from_left(parent, i)
+            elif i + 1 < len(parent.children) and self._can_lend(parent.children[i + 1]):
+                self._borrow_from_right(parent, i)
+            elif i > 0:
+                self._merge(parent, i - 1)
+            else:
+                self._merge(parent, i)
+            node = parent
+        if isinstance(self.root, Internal) and len(self.root.children) == 1:
+            self.root = self.root.children[0]
+
+    def _advance(self, path: List[Tuple[Internal[T], int]]) -> Leaf[T]:
+        """Move path from its leaf to the next leaf and return that leaf."""
+        depth = len(path) - 1
+        while path[depth][1] + 1 == len(path[depth][0].children):
+            depth -= 1
+        parent, i = path[depth]
+        path[depth] = (parent, i + 1)
+        node = parent.children[i + 1]
+        del path[depth + 1:]
+        while isinstance(node, Internal):
+            path.append((node, 0))
+            node = node.children[0]
+        return node
+
+    def _underfull(self, node: Node) -> bool:
+        if isinstance(node, Internal):
+            return len(node.children) < self.min_fill
+        return len(node.keys) < self.min_fill
+
+    def _can_lend(self, node: Node) -> bool:
+        if isinstance(node, Internal):
+            return len(node.children) > self.min_fill
+        return len(node.keys) > self.min_fill
+
+    def _borrow_from_left(self, parent: Internal[T], i: int) -> None:
+        node, left = parent.children[i], parent.children[i - 1]
+        if isinstance(node, Leaf):
+            node.keys.insert(0, left.keys.pop())
+            parent.keys[i - 1] = node.keys[0]
+        else:
+            node.keys.insert(0, parent.keys[i - 1])
+            node.children.insert(0, left.children.pop())
+            parent.keys[i - 1] = left.keys.pop()
+
+    def _borrow_from_right(self, parent: Internal[T], i: int) -> None:
+        node, right = parent.children[i], parent.children[i + 1]
+        if isinstance(node, Leaf):
+            node.keys.append(right.keys.pop(0))
+            parent.keys[i] = right.keys[0]
+        else:
+            node.keys.append(parent.keys[i])
+            node.children.append(right.children.pop(0))
+            parent.keys[i] = right.keys.pop(0)
+
+    def _merge(self, parent: Internal[T], i: int) -> None:
+        """Fold children[i + 1] into children[i]."""
+        node, right = parent.children[i], parent.children[i + 1]
+        separator = parent.keys.pop(i)
+        parent.children.pop(i + 1)
+        if isinstance(node, Leaf):
+            node.keys.extend(right.keys)
+            node.next = right.next
+            if right.next is not None:
+                right.next.prev = node
+        else:
+            node.keys.append(separator)
+            node.keys.extend(right.keys)
+            node.children.extend(right.children)
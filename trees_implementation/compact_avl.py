@@ -0,0 +1,471 @@
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from AVL import BinarySearchTreeInterface, T
+from paging import paginate
+
+NIL = -1  # Id of the missing node, the counterpart of None in AVL
+
+
+class CompactAVL(BinarySearchTreeInterface[T]):
+    """AVL tree whose nodes are integer ids into parallel columns.
+
+    Node i is spread over values[i], left[i], right[i], parent[i],
+    height[i] and size[i]. The links are 32-bit ints and the height one
+    byte, so there is no TreeNode object per key. Deleted ids go on a free
+    list threaded through left[] and are reused by later inserts.
+
+    The API is AVL's with node ids in place of TreeNode objects and NIL
+    where AVL uses None; value(node) reads the value of a node.
+    """
+
+    def __init__(self) -> None:
+        self.root = NIL
+        self._values: List[Any] = []
+        self._left = array('i')
+        self._right = array('i')
+        self._parent = array('i')
+        self._height = array('b')  # An AVL tree of 2**31 keys is under 45 levels tall
+        self._size = array('i')
+        self._free = NIL  # Head of the free list, chained through _left
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[T]) -> "CompactAVL[T]":
+        # Same construction as AVL.from_sorted, writing the columns directly
+        values = list(values)
+        if any(b < a for a, b in zip(values, values[1:])):  # type: ignore
+            raise ValueError("from_sorted needs the values in ascending order")
+        tree: CompactAVL[T] = cls()
+        n = len(values)
+        if n == 0:
+            return tree
+        left = array('i', [NIL]) * n
+        right = array('i', [NIL]) * n
+        parent = array('i', [NIL]) * n
+        height = array('b', [0]) * n
+        size = array('i', [0]) * n
+        pending: List[Tuple[int, int, int, bool]] = [(0, n, NIL, False)]
+        while pending:
+            lo, hi, up, is_left = pending.pop()
+            mid = (lo + hi) // 2
+            height[mid] = (hi - lo).bit_length()
+            size[mid] = hi - lo
+            parent[mid] = up
+            if up == NIL:
+                tree.root = mid
+            elif is_left:
+                left[up] = mid
+            else:
+                right[up] = mid
+            if lo < mid:
+                pending.append((lo, mid, mid, True))
+            if mid + 1 < hi:
+                pending.append((mid + 1, hi, mid, False))
+        tree._values = values
+        tree._left, tree._right, tree._parent = left, right, parent
+        tree._height, tree._size = height, size
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> "CompactAVL[T]":
+        return cls.from_sorted(sorted(values))  # type: ignore
+
+    def _new_node(self, value: T) -> int:
+        node = self._free
+        if node == NIL:
+            node = len(self._values)
+            self._values.append(value)
+            self._left.append(NIL)
+            self._right.append(NIL)
+            self._parent.append(NIL)
+            self._height.append(1)
+            self._size.append(1)
+            return node
+        self._free = self._left[node]
+        self._values[node] = value
+        self._left[node] = self._right[node] = self._parent[node] = NIL
+        self._height[node] = 1
+        self._size[node] = 1
+        return node
+
+    def _release(self, node: int) -> None:
+        self._values[node] = None  # Drop the reference to the value
+        self._left[node] = self._free
+        self._free = node
+
+    def value(self, node: int) -> T:
+        return self._values[node]
+
+    def size(self, start: int) -> int:
+        if start == NIL:
+            return 0
+        return self._size[start]
+
+    def inorder(self, start: int) -> None:
+        if start == NIL:
+            return
+        node = self.leftdescendant(start)
+        while node != NIL:
+            print(self._values[node], end=" ")
+            node = self.inorder_next(node, start)
+
+    def postorder(self, start: int) -> None:
+        if start == NIL:
+            return
+        node = self.deepest_first(start)
+        while node != NIL:
+            print(self._values[node], end=" ")
+            node = self.postorder_next(node, start)
+
+    def preorder(self, start: int) -> None:
+        node = start
+        while node != NIL:
+            print(self._values[node], end=" ")
+            node = self.preorder_next(node, start)
+
+    # Successors within the subtree rooted at start, as in AVL
+    def inorder_next(self, node: int, start: int) -> int:
+        if self._right[node] != NIL:
+            return self.leftdescendant(self._right[node])
+        parent = self._parent
+        while node != start:
+            up = parent[node]
+            if node == self._left[up]:
+                return up
+            node = up
+        return NIL
+
+    def preorder_next(self, node: int, start: int) -> int:
+        left, right, parent = self._left, self._right, self._parent
+        if left[node] != NIL:
+            return left[node]
+        if right[node] != NIL:
+            return right[node]
+        while node != start:
+            up = parent[node]
+            if node == left[up] and right[up] != NIL:
+                return right[up]
+            node = up
+        return NIL
+
+    def deepest_first(self, start: int) -> int:
+        """First node of start's subtree in postorder."""
+        left, right = self._left, self._right
+        while True:
+            if left[start] != NIL:
+                start = left[start]
+            elif right[start] != NIL:
+                start = right[start]
+            else:
+                return start
+
+    def postorder_next(self, node: int, start: int) -> int:
+        if node == start:
+            return NIL
+        up = self._parent[node]
+        if node == self._left[up] and self._right[up] != NIL:
+            return self.deepest_first(self._right[up])
+        return up
+
+    def leveltraversal(self) -> None:
+        level = [self.root] if self.root != NIL else []
+        while level:
+            for node in level:
+                print(self._values[node])
+            level = [child for node in level for child in (self._left[node], self._right[node])
+                     if child != NIL]
+
+    def leftdescendant(self, start: int) -> int:
+        left = self._left
+        while left[start] != NIL:
+            start = left[start]
+        return start
+
+    def rightancestor(self, start: int) -> int:
+        parent = self._parent
+        while parent[start] != NIL:
+            if start == self._left[parent[start]]:
+                return parent[start]
+            start = parent[start]
+        return NIL
+
+    def next(self, start: int) -> int:
+        if self._right[start] != NIL:
+            return self.leftdescendant(self._right[start])
+        return self.rightancestor(start)
+
+    def rangesearch(self, x: T, y: T, start: int) -> List[T]:
+        L: List[T] = []
+        N = self.find(x, start)
+        while N != NIL and self._values[N] <= y:  # type: ignore
+            if self._values[N] >= x:  # type: ignore
+                L.append(self._values[N])
+            N = self.next(N)
+        return L
+
+    def irange(self, lo: Optional[T] = None, hi: Optional[T] = None, reverse: bool = False) -> Iterator[T]:
+        """Same contract as AVL.irange."""
+        values, left, right = self._values, self._left, self._right
+        stack: List[int] = []
+        node = self.root
+        if not reverse:
+            while node != NIL:
+                if lo is not None and values[node] < lo:  # type: ignore
+                    node = right[node]
+                else:
+                    stack.append(node)
+                    node = left[node]
+            while stack:
+                node = stack.pop()
+                if hi is not None and values[node] > hi:  # type: ignore
+                    return
+                yield values[node]
+                node = right[node]
+                while node != NIL:
+                    stack.append(node)
+                    node = left[node]
+        else:
+            while node != NIL:
+                if hi is not None and values[node] > hi:  # type: ignore
+                    node = left[node]
+                else:
+                    stack.append(node)
+                    node = right[node]
+            while stack:
+                node = stack.pop()
+                if lo is not None and values[node] < lo:  # type: ignore
+                    return
+                yield values[node]
+                node = left[node]
+                while node != NIL:
+                    stack.append(node)
+                    node = right[node]
+
+    def page(self, lo: Optional[T], hi: Optional[T], limit: int, cursor: Optional[Tuple[T, int]] = None,
+             reverse: bool = False) -> Tuple[List[T], Optional[Tuple[T, int]]]:
+        """Same contract as AVL.page."""
+        return paginate(self.irange, lo, hi, limit, cursor, reverse)
+
+    def height(self, start: int) -> int:
+        if start == NIL:
+            return 0
+        return self._height[start]
+
+    def update_height(self, node: int) -> None:
+        if node != NIL:
+            self._height[node] = 1 + max(self.height(self._left[node]), self.height(self._right[node]))
+
+    def update_size(self, node: int) -> None:
+        if node != NIL:
+            self._size[node] = 1 + self.size(self._left[node]) + self.size(self._right[node])
+
+    def balance_factor(self, node: int) -> int:
+        if node == NIL:
+            return 0
+        return self.height(self._left[node]) - self.height(self._right[node])
+
+    def _replace_child(self, up: int, old: int, new: int) -> None:
+        """Point up's link (or the root) at new where it pointed at old."""
+        if up == NIL:
+            self.root = new
+        elif self._left[up] == old:
+            self._left[up] = new
+        else:
+            self._right[up] = new
+
+    def rotate_right(self, y: int) -> int:
+        left, right, parent = self._left, self._right, self._parent
+        x = left[y]
+        if x == NIL:
+            return y
+        T2 = right[x]
+
+        # Perform rotation
+        right[x] = y
+        left[y] = T2
+
+        # Update parent pointers
+        parent[x] = parent[y]
+        parent[y] = x
+        if T2 != NIL:
+            parent[T2] = y
+        self._replace_child(parent[x], y, x)
+
+        # Update heights and sizes
+        self.update_height(y)
+        self.update_height(x)
+        self.update_size(y)
+        self.update_size(x)
+        return x
+
+    def rotate_left(self, x: int) -> int:
+        left, right, parent = self._left, self._right, self._parent
+        y = right[x]
+        if y == NIL:
+            return x
+        T2 = left[y]
+
+        # Perform rotation
+        left[y] = x
+        right[x] = T2
+
+        # Update parent pointers
+        parent[y] = parent[x]
+        parent[x] = y
+        if T2 != NIL:
+            parent[T2] = x
+        self._replace_child(parent[y], x, y)
+
+        # Update heights and sizes
+        self.update_height(x)
+        self.update_height(y)
+        self.update_size(x)
+        self.update_size(y)
+        return y
+
+    def rebalance(self, node: int) -> int:
+        if node == NIL:
+            return NIL
+
+        self.update_height(node)
+        self.update_size(node)
+        balance = self.balance_factor(node)
+
+        # Left Heavy
+        if balance > 1 and self._left[node] != NIL:
+            # Left-Right Case
+            if self.balance_factor(self._left[node]) < 0:
+                self.rotate_left(self._left[node])
+            return self.rotate_right(node)
+
+        # Right Heavy
+        if balance < -1 and self._right[node] != NIL:
+            # Right-Left Case
+            if self.balance_factor(self._right[node]) > 0:
+                self.rotate_right(self._right[node])
+            return self.rotate_left(node)
+
+        return node
+
+    def find(self, key: T, start: int) -> int:
+        # Node holding key, or the last node on the search path
+        if start == NIL:
+            return NIL
+        values, left, right = self._values, self._left, self._right
+        while True:
+            value = values[start]
+            if value == key:
+                return start
+            child = left[start] if key < value else right[start]  # type: ignore
+            if child == NIL:
+                return start
+            start = child
+
+    # Order statistics from the subtree sizes, as in AVL
+    def count_below(self, key: T, inclusive: bool = False) -> int:
+        """Number of values < key, or <= key if inclusive."""
+        values, left, right = self._values, self._left, self._right
+        count = 0
+        node = self.root
+        while node != NIL:
+            value = values[node]
+            if value < key or (inclusive and value == key):  # type: ignore
+                count += self.size(left[node]) + 1
+                node = right[node]
+            else:
+                node = left[node]
+        return count
+
+    def rank(self, key: T) -> int:
+        return self.count_below(key)
+
+    def select(self, k: int) -> T:
+        """The k-th smallest value, counting from 0."""
+        if not 0 <= k < self.size(self.root):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            smaller = self.size(self._left[node])
+            if k < smaller:
+                node = self._left[node]
+            elif k == smaller:
+                return self._values[node]
+            else:
+                k -= smaller + 1
+                node = self._right[node]
+
+    def count_range(self, x: T, y: T) -> int:
+        if y < x:  # type: ignore
+            return 0
+        return self.count_below(y, inclusive=True) - self.count_below(x)
+
+    def median(self) -> T:
+        """Lower median: the middle value, or the smaller of the two middle ones."""
+        n = self.size(self.root)
+        if n == 0:
+            raise IndexError("median of an empty tree")
+        return self.select((n - 1) // 2)
+
+    def insert(self, value: T) -> None:
+        new_node = self._new_node(value)
+        if self.root == NIL:
+            self.root = new_node
+            return
+
+        # Walk down to an empty slot, equal values going right
+        values, left, right = self._values, self._left, self._right
+        parent = self.root
+        while True:
+            child = left[parent] if value < values[parent] else right[parent]  # type: ignore
+            if child == NIL:
+                break
+            parent = child
+
+        self._parent[new_node] = parent
+        if value < values[parent]:  # type: ignore
+            left[parent] = new_node
+        else:
+            right[parent] = new_node
+
+        # Rebalance from the new node up to the root
+        current = parent
+        while current != NIL:
+            current = self._parent[self.rebalance(current)]
+
+    def delete(self, value: T) -> None:
+        node = self.find(value, self.root)
+        if node == NIL or self._values[node] != value:
+            return
+        left, right, parent = self._left, self._right, self._parent
+
+        # Two children: take the successor's value and delete the successor,
+        # which has no left child
+        if left[node] != NIL and right[node] != NIL:
+            successor = self.leftdescendant(right[node])
+            self._values[node] = self._values[successor]
+            node = successor
+
+        # Splice out node, which has at most one child
+        child = left[node] if left[node] != NIL else right[node]
+        up = parent[node]
+        if child != NIL:
+            parent[child] = up
+        self._replace_child(up, node, child)
+        self._release(node)
+
+        # Rebalance from the parent of the deleted node up to the root
+        current = up
+        while current != NIL:
+            current = parent[self.rebalance(current)]
+
+    def memory_usage(self) -> Dict[str, float]:
+        """Bytes used by the node columns, excluding the value objects."""
+        columns = (self._values, self._left, self._right, self._parent, self._height, self._size)
+        total = sum(sys.getsizeof(column) for column in columns)
+        count = self.size(self.root)
+        return {
+            "nodes": len(self._values),
+            "total": total,
+            "bytes_per_key": total / count if count else 0.0,
+        }
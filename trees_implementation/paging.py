@@ -0,0 +1,46 @@
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+Cursor = Tuple[T, int]
+
+
+def paginate(scan: Callable[[Optional[T], Optional[T], bool], Iterator[T]], lo: Optional[T], hi: Optional[T],
+             limit: int, cursor: Optional[Cursor] = None,
+             reverse: bool = False) -> Tuple[List[T], Optional[Cursor]]:
+    """Up to limit values of scan(lo, hi, reverse) following cursor.
+
+    scan is a tree's irange. Returns the page and the cursor of the next
+    page, or None once the range is exhausted. The cursor is (last value,
+    times it has been returned so far), so runs of duplicates can span
+    pages.
+    """
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    skip = 0
+    last: Optional[T] = None
+    if cursor is not None:
+        last, skip = cursor
+        if reverse:
+            hi = last
+        else:
+            lo = last
+    items: List[T] = []
+    for value in scan(lo, hi, reverse):
+        if skip and value == last:
+            skip -= 1
+            continue
+        skip = 0
+        items.append(value)
+        if len(items) == limit:
+            break
+    if len(items) < limit:
+        return items, None
+    repeats = 0
+    for value in reversed(items):
+        if value != items[-1]:
+            break
+        repeats += 1
+    if cursor is not None and items[-1] == cursor[0]:
+        repeats += cursor[1]
+    return items, (items[-1], repeats)